@@ -3,11 +3,20 @@ Alert API router.
 """
 
 import asyncio
-from typing import Optional, Literal
+import base64
+import binascii
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import AsyncIterator, List, Literal, Optional, Tuple
 from urllib.parse import unquote
 
+import orjson
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from bson import ObjectId
+from bson.errors import InvalidId
 
 from api.alerts.schemas import (
     AlertResponse,
@@ -16,7 +25,8 @@ from api.alerts.schemas import (
     AlertStatsResponse,
 )
 from database import get_database
-from repositories.risk_alert import RiskAlertRepository
+from models.risk_alert import RiskAlert
+from repositories.risk_alert import KEYSET_SORT, RiskAlertRepository, keyset_filter
 from repositories.package import PackageRepository
 
 router = APIRouter(
@@ -24,53 +34,217 @@ router = APIRouter(
     tags=["alerts"],
 )
 
+# Cheap syntactic check for 24-char hex ObjectIds in path parameters
+OBJECT_ID_RE = re.compile(r"[0-9a-fA-F]{24}")
 
-def get_alert_repository() -> RiskAlertRepository:
-    """Dependency injection for RiskAlertRepository."""
+# Encoded /alerts/stats body, shared by every dashboard poller in this process
+STATS_CACHE_KEY = "alerts:stats:global"
+STATS_CACHE_TTL_SECONDS = 60
+_stats_cache: TTLCache = TTLCache(maxsize=1, ttl=STATS_CACHE_TTL_SECONDS)
+
+
+@lru_cache
+def _alert_repository() -> RiskAlertRepository:
     return RiskAlertRepository(get_database())
 
 
-def get_package_repository() -> PackageRepository:
-    """Dependency injection for PackageRepository."""
+async def get_alert_repository() -> RiskAlertRepository:
+    """Dependency injection for RiskAlertRepository."""
+    return _alert_repository()
+
+
+@lru_cache
+def _package_repository() -> PackageRepository:
     return PackageRepository(get_database())
 
 
-async def enrich_alert_with_package_name(
-    alert: dict, package_repo: PackageRepository
-) -> AlertResponse:
+async def get_package_repository() -> PackageRepository:
+    """Dependency injection for PackageRepository."""
+    return _package_repository()
+
+
+def format_timestamp(value: datetime) -> str:
     """
-    Enrich alert with package name from packages collection.
+    Format a UTC datetime the same way listing aggregations render timestamps.
 
     Args:
-        alert: Alert document from database
+        value: Naive-UTC or UTC-aware datetime
+
+    Returns:
+        ISO-8601 string with millisecond precision and a Z suffix
+    """
+    return f"{value:%Y-%m-%dT%H:%M:%S}.{value.microsecond // 1000:03d}Z"
+
+
+def encode_cursor(alert: dict) -> str:
+    """
+    Encode the keyset position of an alert as an opaque pagination cursor.
+
+    Args:
+        alert: AlertResponse-shaped alert dict (the last one on a page)
+
+    Returns:
+        URL-safe base64 of "timestamp|_id"
+    """
+    raw = f"{alert['timestamp']}|{alert['id']}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, ObjectId]:
+    """
+    Decode a pagination cursor produced by encode_cursor.
+
+    Args:
+        cursor: Opaque cursor string
+
+    Returns:
+        (timestamp, _id) keyset position
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    try:
+        timestamp, alert_id = (
+            base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        )
+        return datetime.fromisoformat(timestamp), ObjectId(alert_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError, InvalidId):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+
+def alert_page_response(
+    alerts: List[dict], total: int, skip: int, limit: int, has_more: bool
+) -> ORJSONResponse:
+    """
+    Build a ListAlertsResponse-shaped JSON response from a fetched page.
+
+    Args:
+        alerts: AlertResponse-shaped alert dicts
+        total: Total number of matching alerts
+        skip: Number of alerts skipped
+        limit: Maximum alerts per page
+        has_more: Whether more alerts follow this page
+
+    Returns:
+        ORJSONResponse with alerts, total, skip, limit and next_cursor
+    """
+    return ORJSONResponse(
+        {
+            "alerts": alerts,
+            "total": total,
+            "skip": skip,
+            "limit": limit,
+            "next_cursor": encode_cursor(alerts[-1]) if has_more else None,
+        }
+    )
+
+
+async def prepend_alert(
+    first: Optional[dict], rest: AsyncIterator[dict]
+) -> AsyncIterator[dict]:
+    """
+    Put an already-fetched first alert back in front of the rest of a stream.
+
+    Args:
+        first: First alert, or None if the stream was empty
+        rest: Remaining alerts
+
+    Yields:
+        AlertResponse-shaped alert dicts
+    """
+    try:
+        if first is not None:
+            yield first
+            async for alert in rest:
+                yield alert
+    finally:
+        await rest.aclose()
+
+
+async def stream_alert_page(
+    alerts: AsyncIterator[dict], total: int, skip: int, limit: int
+) -> AsyncIterator[bytes]:
+    """
+    Encode a ListAlertsResponse body incrementally, one alert at a time.
+
+    A failure while draining later batches ends the stream with an error
+    (the connection is aborted) rather than a complete-looking body.
+
+    Args:
+        alerts: AlertResponse-shaped alert dicts (up to limit + 1 of them)
+        total: Total number of matching alerts
+        skip: Number of alerts skipped
+        limit: Maximum alerts per page
+
+    Yields:
+        Chunks of the JSON response body
+    """
+    try:
+        yield b'{"alerts":['
+        last = None
+        has_more = False
+        count = 0
+        async for alert in alerts:
+            if count == limit:
+                has_more = True
+                break
+            yield (b"," if count else b"") + orjson.dumps(alert)
+            last = alert
+            count += 1
+
+        yield orjson.dumps(
+            {
+                "total": total,
+                "skip": skip,
+                "limit": limit,
+                "next_cursor": encode_cursor(last) if has_more else None,
+            }
+        ).replace(b"{", b"],", 1)
+    finally:
+        await alerts.aclose()
+
+
+async def enrich_alerts_with_package_names(
+    alerts: List[RiskAlert], package_repo: PackageRepository
+) -> List[dict]:
+    """
+    Enrich alerts with package names using one batched packages query.
+
+    Dates are formatted with format_timestamp so single alerts serialize
+    exactly like the ones in listing aggregations.
+
+    Args:
+        alerts: Validated alert models from the repository
         package_repo: Package repository instance
 
     Returns:
-        AlertResponse with package_name populated
+        AlertResponse-shaped alert dicts with package_name populated
     """
-    # Get package name
-    package = await package_repo.find_by_id(alert["package_id"])
-    package_name = package.name if package else "unknown"
-
-    # Convert ObjectIds to strings
-    alert_dict = {
-        "id": str(alert["_id"]),
-        "package_id": str(alert["package_id"]),
-        "package_name": package_name,
-        "identity_id": str(alert["identity_id"]) if alert.get("identity_id") else None,
-        "release_id": str(alert["release_id"]) if alert.get("release_id") else None,
-        "delta_id": str(alert["delta_id"]) if alert.get("delta_id") else None,
-        "reason": alert["reason"],
-        "severity": alert["severity"],
-        "timestamp": alert["timestamp"],
-        "status": alert["status"],
-        "analysis": alert["analysis"],
-    }
-
-    return AlertResponse(**alert_dict)
-
-
-@router.get("/", response_model=ListAlertsResponse)
+    packages = await package_repo.find_by_ids(alert.package_id for alert in alerts)
+    name_by_id = {package.id: package.name for package in packages}
+
+    return [
+        {
+            "id": str(alert.id),
+            "package_id": str(alert.package_id),
+            "package_name": name_by_id.get(alert.package_id, "unknown"),
+            "identity_id": str(alert.identity_id) if alert.identity_id else None,
+            "release_id": str(alert.release_id) if alert.release_id else None,
+            "delta_id": str(alert.delta_id) if alert.delta_id else None,
+            "reason": alert.reason,
+            "severity": alert.severity,
+            "timestamp": format_timestamp(alert.timestamp),
+            "status": alert.status,
+            "analysis": {
+                **alert.analysis.model_dump(),
+                "updated_at": format_timestamp(alert.analysis.updated_at),
+            },
+        }
+        for alert in alerts
+    ]
+
+
+@router.get("/", response_model=None, responses={200: {"model": ListAlertsResponse}})
 async def list_alerts(
     skip: int = Query(0, ge=0, description="Number of alerts to skip"),
     limit: int = Query(20, ge=1, le=100, description="Maximum alerts to return"),
@@ -81,8 +255,10 @@ async def list_alerts(
         None, ge=0, le=100, description="Minimum severity score"
     ),
     package_name: Optional[str] = Query(None, description="Filter by package name"),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from a previous page's next_cursor (overrides skip)"
+    ),
     alert_repo: RiskAlertRepository = Depends(get_alert_repository),
-    package_repo: PackageRepository = Depends(get_package_repository),
 ):
     """
     List alerts with filtering and pagination.
@@ -92,7 +268,8 @@ async def list_alerts(
     - severity_min: Filter by minimum severity score
     - package_name: Filter by package name
 
-    Results are sorted by timestamp (newest first).
+    Results are sorted by timestamp (newest first). Pass the returned
+    next_cursor as `cursor` to fetch the following page.
     """
     # Build filter query
     filter_query = {}
@@ -103,89 +280,85 @@ async def list_alerts(
     if severity_min is not None:
         filter_query["severity"] = {"$gte": severity_min}
 
-    # If package_name filter is provided, resolve package_id first
+    # Package name filter: match the package and page its alerts in one aggregation
     if package_name:
-        package_name = unquote(package_name)
-        package = await package_repo.find_by_name(package_name)
-        if not package:
-            # No alerts if package doesn't exist
-            return ListAlertsResponse(alerts=[], total=0, skip=skip, limit=limit)
-        filter_query["package_id"] = package.id
-
-    # Get alerts
-    alerts = await alert_repo.find_many(
-        filter_query, skip=skip, limit=limit, sort=[("timestamp", -1)]
+        after = decode_cursor(cursor) if cursor else None
+        if after:
+            skip = 0
+        page = await alert_repo.find_page_for_package_name(
+            unquote(package_name),
+            filter_query,
+            skip=skip,
+            limit=limit,
+            after=after,
+        )
+        # No alerts if package doesn't exist
+        alerts, total, has_more = page or ([], 0, False)
+        return alert_page_response(alerts, total, skip, limit, has_more)
+
+    # Stream alerts joined with package names while counting the total
+    page_filter = filter_query
+    if cursor:
+        page_filter = keyset_filter(filter_query, decode_cursor(cursor))
+        skip = 0
+
+    alerts = alert_repo.stream_alerts_with_packages(
+        page_filter, skip=skip, limit=limit + 1, sort=KEYSET_SORT
     )
-    total = await alert_repo.count(filter_query)
-
-    # Enrich with package names
-    enriched_alerts = []
-    for alert in alerts:
-        alert_dict = alert.model_dump(by_alias=True)
-        enriched_alert = await enrich_alert_with_package_name(alert_dict, package_repo)
-        enriched_alerts.append(enriched_alert)
-
-    return ListAlertsResponse(
-        alerts=enriched_alerts,
-        total=total,
-        skip=skip,
-        limit=limit,
+    total = asyncio.create_task(alert_repo.count(filter_query))
+
+    # Run the aggregation (up to its first batch) and the count before any
+    # bytes are sent, so query and connection errors still produce an error
+    # status instead of a truncated 200 body
+    try:
+        first_alert, total_count = await asyncio.gather(anext(alerts, None), total)
+    except BaseException:
+        total.cancel()
+        await alerts.aclose()
+        raise
+
+    return StreamingResponse(
+        stream_alert_page(prepend_alert(first_alert, alerts), total_count, skip, limit),
+        media_type="application/json",
     )
 
 
-@router.get("/stats", response_model=AlertStatsResponse)
+@router.get("/stats", response_model=None, responses={200: {"model": AlertStatsResponse}})
 async def get_alert_stats(
     alert_repo: RiskAlertRepository = Depends(get_alert_repository),
-    package_repo: PackageRepository = Depends(get_package_repository),
 ):
     """
     Get dashboard statistics for alerts.
 
     Returns summary counts by status, severity metrics, and recent alerts.
+    The encoded body is cached for STATS_CACHE_TTL_SECONDS.
     """
-    # Get counts by status
-    total_alerts = await alert_repo.count()
-    open_alerts = await alert_repo.count({"status": "open"})
-    investigated_alerts = await alert_repo.count({"status": "investigated"})
-    resolved_alerts = await alert_repo.count({"status": "resolved"})
-
-    # Get high severity count
-    high_severity_count = await alert_repo.count({"severity": {"$gte": 70.0}})
-
-    # Calculate average severity using aggregation
-    db = alert_repo.database
-    pipeline = [
-        {"$group": {"_id": None, "avg_severity": {"$avg": "$severity"}}},
-    ]
-    result = await asyncio.to_thread(
-        lambda: list(db.risk_alerts.aggregate(pipeline))
+    cached = _stats_cache.get(STATS_CACHE_KEY)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    # Counts, average severity and recent alerts in one $facet round trip
+    stats = await alert_repo.get_stats()
+    by_status = stats["by_status"]
+    average_severity = stats["average_severity"]
+
+    body = orjson.dumps(
+        {
+            "total_alerts": stats["total"],
+            "open_alerts": by_status.get("open", 0),
+            "investigated_alerts": by_status.get("investigated", 0),
+            "resolved_alerts": by_status.get("resolved", 0),
+            "high_severity_count": stats["high_severity_count"],
+            "average_severity": round(average_severity, 2) if average_severity else 0.0,
+            "recent_alerts": stats["recent_alerts"],
+        }
     )
-    average_severity = result[0]["avg_severity"] if result else 0.0
+    _stats_cache[STATS_CACHE_KEY] = body
 
-    # Get recent alerts (last 5)
-    recent_alert_docs = await alert_repo.find_many(
-        {}, skip=0, limit=5, sort=[("timestamp", -1)]
-    )
-
-    # Enrich recent alerts
-    recent_alerts = []
-    for alert in recent_alert_docs:
-        alert_dict = alert.model_dump(by_alias=True)
-        enriched_alert = await enrich_alert_with_package_name(alert_dict, package_repo)
-        recent_alerts.append(enriched_alert)
-
-    return AlertStatsResponse(
-        total_alerts=total_alerts,
-        open_alerts=open_alerts,
-        investigated_alerts=investigated_alerts,
-        resolved_alerts=resolved_alerts,
-        high_severity_count=high_severity_count,
-        average_severity=round(average_severity, 2) if average_severity else 0.0,
-        recent_alerts=recent_alerts,
-    )
+    return Response(content=body, media_type="application/json")
 
 
-@router.get("/{alert_id}", response_model=AlertResponse)
+@router.get("/{alert_id}", response_model=None, responses={200: {"model": AlertResponse}})
 async def get_alert(
     alert_id: str,
     alert_repo: RiskAlertRepository = Depends(get_alert_repository),
@@ -197,7 +370,7 @@ async def get_alert(
     Returns 404 if alert not found.
     """
     # Validate ObjectId format
-    if not ObjectId.is_valid(alert_id):
+    if not OBJECT_ID_RE.fullmatch(alert_id):
         raise HTTPException(status_code=400, detail="Invalid alert ID format")
 
     # Find alert
@@ -206,11 +379,15 @@ async def get_alert(
         raise HTTPException(status_code=404, detail=f"Alert '{alert_id}' not found")
 
     # Enrich with package name
-    alert_dict = alert.model_dump(by_alias=True)
-    return await enrich_alert_with_package_name(alert_dict, package_repo)
+    (response,) = await enrich_alerts_with_package_names([alert], package_repo)
+    return ORJSONResponse(response)
 
 
-@router.get("/package/{package_name:path}", response_model=ListAlertsResponse)
+@router.get(
+    "/package/{package_name:path}",
+    response_model=None,
+    responses={200: {"model": ListAlertsResponse}},
+)
 async def get_alerts_for_package(
     package_name: str,
     skip: int = Query(0, ge=0, description="Number of alerts to skip"),
@@ -218,53 +395,45 @@ async def get_alerts_for_package(
     status: Optional[Literal["open", "investigated", "resolved"]] = Query(
         None, description="Filter by status"
     ),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from a previous page's next_cursor (overrides skip)"
+    ),
     alert_repo: RiskAlertRepository = Depends(get_alert_repository),
-    package_repo: PackageRepository = Depends(get_package_repository),
 ):
     """
     Get all alerts for a specific package.
 
     Supports filtering by status and pagination.
-    Results are sorted by timestamp (newest first).
+    Results are sorted by timestamp (newest first). Pass the returned
+    next_cursor as `cursor` to fetch the following page.
     """
     # URL-decode to handle scoped packages
     package_name = unquote(package_name)
 
-    # Find package
-    package = await package_repo.find_by_name(package_name)
-    if not package:
-        raise HTTPException(status_code=404, detail=f"Package '{package_name}' not found")
-
-    if not package.id:
-        raise HTTPException(status_code=500, detail="Package ID is missing")
-
     # Build filter
-    filter_query = {"package_id": package.id}
+    filter_query = {}
     if status:
         filter_query["status"] = status
 
-    # Get alerts
-    alerts = await alert_repo.find_many(
-        filter_query, skip=skip, limit=limit, sort=[("timestamp", -1)]
-    )
-    total = await alert_repo.count(filter_query)
-
-    # Enrich with package names (will all be the same package_name)
-    enriched_alerts = []
-    for alert in alerts:
-        alert_dict = alert.model_dump(by_alias=True)
-        enriched_alert = await enrich_alert_with_package_name(alert_dict, package_repo)
-        enriched_alerts.append(enriched_alert)
-
-    return ListAlertsResponse(
-        alerts=enriched_alerts,
-        total=total,
+    # Match the package and page its alerts in one aggregation
+    after = decode_cursor(cursor) if cursor else None
+    if after:
+        skip = 0
+    page = await alert_repo.find_page_for_package_name(
+        package_name,
+        filter_query,
         skip=skip,
         limit=limit,
+        after=after,
     )
+    if page is None:
+        raise HTTPException(status_code=404, detail=f"Package '{package_name}' not found")
 
+    alerts, total, has_more = page
+    return alert_page_response(alerts, total, skip, limit, has_more)
 
-@router.patch("/{alert_id}/status", response_model=AlertResponse)
+
+@router.patch("/{alert_id}/status", response_model=None, responses={200: {"model": AlertResponse}})
 async def update_alert_status(
     alert_id: str,
     request: UpdateAlertStatusRequest,
@@ -282,7 +451,7 @@ async def update_alert_status(
     - resolved -> open (reopen)
     """
     # Validate ObjectId format
-    if not ObjectId.is_valid(alert_id):
+    if not OBJECT_ID_RE.fullmatch(alert_id):
         raise HTTPException(status_code=400, detail="Invalid alert ID format")
 
     # Find alert
@@ -295,6 +464,9 @@ async def update_alert_status(
     if not updated_alert:
         raise HTTPException(status_code=500, detail="Failed to update alert status")
 
+    # Status counts changed; drop the cached dashboard stats
+    _stats_cache.pop(STATS_CACHE_KEY, None)
+
     # Enrich with package name
-    alert_dict = updated_alert.model_dump(by_alias=True)
-    return await enrich_alert_with_package_name(alert_dict, package_repo)
+    (response,) = await enrich_alerts_with_package_names([updated_alert], package_repo)
+    return ORJSONResponse(response)
@@ -2,7 +2,6 @@
 Alert API request/response schemas.
 """
 
-from datetime import datetime
 from typing import List, Literal, Optional
 
 from pydantic import BaseModel, Field
@@ -25,7 +24,7 @@ class AlertResponse(BaseModel):
 
     reason: str = Field(..., description="Short human-readable reason for alert")
     severity: float = Field(..., ge=0, le=100, description="Severity score 0-100")
-    timestamp: datetime = Field(..., description="When alert was created")
+    timestamp: str = Field(..., description="When alert was created (ISO-8601, UTC)")
     status: Literal["open", "investigated", "resolved"] = Field(..., description="Alert status")
 
     analysis: Analysis = Field(..., description="Detailed analysis of the alert")
@@ -65,6 +64,9 @@ class ListAlertsResponse(BaseModel):
     total: int = Field(..., description="Total number of alerts matching filter")
     skip: int = Field(..., description="Number of alerts skipped")
     limit: int = Field(..., description="Maximum alerts per page")
+    next_cursor: Optional[str] = Field(
+        default=None, description="Cursor for the next page (null on the last page)"
+    )
 
 
 class UpdateAlertStatusRequest(BaseModel):
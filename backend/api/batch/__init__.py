@@ -0,0 +1 @@
+"""Batch API module."""
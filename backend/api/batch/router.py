@@ -0,0 +1,122 @@
+"""
+Batch API router - run several read requests in one HTTP round trip.
+"""
+
+import asyncio
+from typing import Dict
+
+import orjson
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import ORJSONResponse
+
+from api.batch.schemas import BatchRequest, BatchResponse, SubRequest
+
+router = APIRouter(
+    prefix="/batch",
+    tags=["batch"],
+)
+
+_INHERITED_SCOPE_KEYS = ("asgi", "http_version", "scheme", "server", "client", "root_path", "state")
+
+# Per-sub-request deadline; a sub-request that never finishes (e.g. an
+# event stream) gets a 504 instead of holding up the whole batch
+SUB_REQUEST_TIMEOUT_SECONDS = 10
+
+
+async def _dispatch(request: Request, sub: SubRequest) -> Dict[str, object]:
+    """
+    Run one sub-request through the app's full ASGI stack.
+
+    Args:
+        request: Outer batch request (its scope is the template)
+        sub: Sub-request to execute
+
+    Returns:
+        Dict with the sub-response status and decoded body (status 504 if
+        it did not finish within SUB_REQUEST_TIMEOUT_SECONDS)
+    """
+    path, _, query = sub.path.partition("?")
+    # Fresh scope carrying only connection-level keys, so no routing state
+    # from the outer /batch match leaks into the sub-request
+    scope = {
+        key: request.scope[key]
+        for key in _INHERITED_SCOPE_KEYS
+        if key in request.scope
+    }
+    scope.update({
+        "type": "http",
+        "method": sub.method,
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "headers": [(k, v) for k, v in request.scope["headers"] if k != b"content-length"],
+    })
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    status = 500
+    chunks = []
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    try:
+        await asyncio.wait_for(
+            request.app(scope, receive, send), timeout=SUB_REQUEST_TIMEOUT_SECONDS
+        )
+    except asyncio.TimeoutError:
+        print(f"[batch] WARNING: Sub-request {sub.method} {sub.path} timed out")
+        status = 504
+        chunks[:] = [orjson.dumps({"detail": "Sub-request timed out"})]
+    except Exception as e:
+        # Starlette's ServerErrorMiddleware sends a 500 and then re-raises;
+        # keep the failure local to this key instead of failing the batch
+        print(f"[batch] ERROR: Sub-request {sub.method} {sub.path} failed: {e}")
+        if status != 500:
+            # Discard any partial body from a response that had started OK
+            status = 500
+            chunks.clear()
+        if not chunks:
+            chunks.append(orjson.dumps({"detail": "Internal Server Error"}))
+
+    body = b"".join(chunks)
+    try:
+        decoded = orjson.loads(body) if body else None
+    except orjson.JSONDecodeError:
+        decoded = body.decode("utf-8", "replace")
+
+    return {"status": status, "body": decoded}
+
+
+@router.post("", response_model=None, responses={200: {"model": BatchResponse}})
+async def run_batch(batch: BatchRequest, request: Request) -> ORJSONResponse:
+    """
+    Execute keyed GET sub-requests concurrently and return all results.
+
+    Lets a UI fetch e.g. a package, its current assessment and its history
+    in one HTTP round trip. Sub-requests share the server's MongoDB pool and
+    response cache.
+
+    Example:
+        POST /batch
+        {
+            "requests": {
+                "pkg": {"path": "/packages/express"},
+                "threat": {"path": "/threat-surface/package/express"}
+            }
+        }
+    """
+    if any(sub.path.split("?", 1)[0].rstrip("/") == router.prefix for sub in batch.requests.values()):
+        raise HTTPException(status_code=400, detail="Batches cannot be nested")
+
+    keys = list(batch.requests)
+    results = await asyncio.gather(
+        *(_dispatch(request, batch.requests[key]) for key in keys)
+    )
+
+    return ORJSONResponse({"responses": dict(zip(keys, results))})
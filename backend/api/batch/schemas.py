@@ -0,0 +1,36 @@
+"""
+Batch API request/response schemas.
+"""
+
+from typing import Any, Dict, Literal
+
+from pydantic import BaseModel, Field
+
+# Upper bound on sub-requests per batch
+MAX_BATCH_SIZE = 25
+
+
+class SubRequest(BaseModel):
+    """One read request to run inside a batch."""
+
+    method: Literal["GET"] = Field(default="GET", description="HTTP method (reads only)")
+    path: str = Field(..., pattern=r"^/", description="Path with optional query, e.g. /packages/express")
+
+
+class BatchRequest(BaseModel):
+    """Keyed sub-requests to execute concurrently."""
+
+    requests: Dict[str, SubRequest] = Field(..., max_length=MAX_BATCH_SIZE)
+
+
+class SubResponse(BaseModel):
+    """Result of one sub-request."""
+
+    status: int
+    body: Any = None
+
+
+class BatchResponse(BaseModel):
+    """Sub-request results under the caller's keys."""
+
+    responses: Dict[str, SubResponse]
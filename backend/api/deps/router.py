@@ -1,11 +1,11 @@
 from urllib.parse import unquote
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from typing import Dict
 
 from .schemas import FetchDepsRequest, FetchDepsResponse, JobStatusResponse
-from .service import fetch_npm_deps, get_deps_job_status
-from database import get_database
+from .service import fetch_npm_deps, get_deps_job_status, load_dependency_tree, stream_job_status
 
 router = APIRouter(
     prefix="/deps",
@@ -74,8 +74,36 @@ async def get_deps_job_status_endpoint(job_id: str) -> Dict[str, object]:
     return job
 
 
-@router.get("/npm/{package:path}/{version}")
-async def get_dependency_tree(package: str, version: str) -> Dict[str, object]:
+@router.get("/jobs/{job_id}/stream", response_model=None)
+async def stream_deps_job_status(job_id: str) -> StreamingResponse:
+    """
+    Stream status changes of a background job as Server-Sent Events.
+
+    Subscribe once instead of polling /deps/jobs/{job_id}: a `status` event
+    is pushed on every transition (pending → running → completed/failed)
+    and progress update, and the stream closes when the job finishes.
+
+    Args:
+        job_id: Job ID from a fetch/generate response
+
+    Returns:
+        text/event-stream response
+
+    Example:
+        GET /api/deps/jobs/xyz-789/stream
+    """
+    if not get_deps_job_status(job_id):
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+
+    return StreamingResponse(
+        stream_job_status(job_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+@router.get("/npm/{package:path}/{version}", response_model=None)
+async def get_dependency_tree(package: str, version: str) -> ORJSONResponse:
     """
     Get dependency tree from database for a specific package version.
 
@@ -99,11 +127,7 @@ async def get_dependency_tree(package: str, version: str) -> Dict[str, object]:
     package = unquote(package)
     version = unquote(version)
     
-    db = get_database()
-    tree = db.dependency_trees.find_one(
-        {"name": package, "version": version},
-        {"_id": 0}  # Exclude MongoDB _id field
-    )
+    tree = await load_dependency_tree(package, version)
 
     if not tree:
         raise HTTPException(
@@ -111,5 +135,7 @@ async def get_dependency_tree(package: str, version: str) -> Dict[str, object]:
             detail=f"Dependency tree not found for {package}@{version}"
         )
 
-    return tree
+    # Stored trees are plain JSON-compatible documents (datetimes aside, which
+    # orjson encodes natively), so skip jsonable_encoder's recursive walk
+    return ORJSONResponse(tree)
 
@@ -1,26 +1,117 @@
 import asyncio
+import logging
 import os
-from datetime import datetime, timezone
-from typing import Dict, Set, Optional, Any
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Dict, Optional, Any, Set
+
+import orjson
+
+from pymongo.errors import OperationFailure
 
 from database import get_database
-from services.background_jobs import get_job_manager
-from services.npm_client import NpmRegistryClient
+from services.background_jobs import JobStatus, get_job_manager
+from services.npm_client import NpmRegistryClient, get_npm_client
 from services.priority_resource_manager import Priority
 from services.package_service import get_or_create_package_with_enrichment
 from repositories.package import PackageRepository
 
+_LOG = logging.getLogger(__name__)
+
+# Dependency sections of a package.json crawled for each node
+DEP_KINDS = ("dependencies", "devDependencies", "optionalDependencies", "peerDependencies")
+
+# Range operators stripped from a semver spec to get a concrete version
+RANGE_PREFIX_CHARS = "^~>=<"
+
+# Upper bound on in-flight registry fetches across a dependency crawl. The
+# traversal itself stays wide; only the HTTP call waits on this.
+NPM_FETCH_CONCURRENCY = int(os.getenv("NPM_FETCH_CONCURRENCY", "25"))
+
+_fetch_semaphore: Optional[asyncio.Semaphore] = None
+
+# Stored trees younger than this are served instead of re-crawling npm
+MAX_TREE_AGE = timedelta(hours=int(os.getenv("DEPS_CACHE_HOURS", "24")))
+
+
+def _get_fetch_semaphore() -> asyncio.Semaphore:
+    """
+    Get or create the registry fetch semaphore.
+
+    Created lazily so it is bound to the running event loop, not whichever
+    loop (if any) existed at import time.
+
+    Returns:
+        Module-wide fetch semaphore
+    """
+    global _fetch_semaphore
+    if _fetch_semaphore is None:
+        _fetch_semaphore = asyncio.Semaphore(NPM_FETCH_CONCURRENCY)
+    return _fetch_semaphore
+
+
+async def _load_fresh_tree(db, package: str, version: str, depth: int) -> Optional[Dict]:
+    """
+    Load a stored dependency tree if it is recent and crawled deep enough.
+
+    Args:
+        db: Database instance
+        package: Package name
+        version: Package version
+        depth: Requested crawl depth
+
+    Returns:
+        Stored tree (without _id) or None if a fresh crawl is needed
+    """
+    tree = await asyncio.to_thread(
+        db.dependency_trees.find_one,
+        {"name": package, "version": version, "crawl_depth": {"$gte": depth}},
+        {"_id": 0},
+    )
+    if not tree or not tree.get("fetched_at"):
+        return None
+
+    fetched_at = tree["fetched_at"]
+    if fetched_at.tzinfo is None:
+        fetched_at = fetched_at.replace(tzinfo=timezone.utc)
+    if datetime.now(timezone.utc) - fetched_at >= MAX_TREE_AGE:
+        return None
+
+    return tree
+
+
+def _indent(current_depth: int) -> str:
+    """Tree indentation for crawl trace logs (skipped unless DEBUG is on)."""
+    return "  " * current_depth if _LOG.isEnabledFor(logging.DEBUG) else ""
+
+
+async def _attach_child(entry: Dict, dep_name: str, crawl, indent: str) -> None:
+    """
+    Await a child crawl and store its result (or error) on the parent's entry.
+
+    Args:
+        entry: Dependency entry in the parent's result
+        dep_name: Dependency name (for logging)
+        crawl: Child _fetch_npm_deps_internal coroutine
+        indent: Log indentation of the parent
+    """
+    try:
+        entry["children"] = await crawl
+    except Exception as e:
+        _LOG.warning("%s    ✗ Error fetching %s: %s", indent, dep_name, e)
+        entry["children"] = {"error": str(e)}
+
 
 async def _fetch_npm_deps_internal(
     package: str,
     version: str,
     depth: int = 2,
     priority: Priority = Priority.HIGH,  # User-initiated dependency fetch
-    _visited: Optional[Set[str]] = None,
+    _memo: Optional[Dict[str, "asyncio.Future[Dict]"]] = None,
     _current_depth: int = 0,
     _db=None,
     _npm_client: Optional[NpmRegistryClient] = None,
-    _package_repo: Optional[PackageRepository] = None
+    _package_repo: Optional[PackageRepository] = None,
+    _enriched: Optional[Set[str]] = None,
 ) -> Dict:
     """
     Recursively fetch npm package dependencies.
@@ -29,53 +120,108 @@ async def _fetch_npm_deps_internal(
         package: Package name
         version: Package version
         depth: Maximum recursion depth
-        _visited: Internal set to track visited packages (prevents circular deps)
+        _memo: Internal memo of crawled nodes shared across one tree crawl
+        _enriched: Internal set of package names already ensured in this crawl
         _current_depth: Internal counter for current depth
 
     Returns:
         Dictionary with package info and nested dependencies
     """
-    if _visited is None:
-        _visited = set()
+    if _memo is None:
+        _memo = {}
+    if _enriched is None:
+        _enriched = set()
 
     # Initialize services at root level
     if _npm_client is None:
-        _npm_client = NpmRegistryClient()
+        _npm_client = get_npm_client()
     if _package_repo is None:
         if _db is None:
             _db = get_database()
         _package_repo = PackageRepository(_db)
 
-    indent = "  " * _current_depth
-    print(f"{indent}→ Fetching {package}@{version} (depth {_current_depth}/{depth})")
+    indent = _indent(_current_depth)
+    _LOG.debug("%s→ Fetching %s@%s (depth %s/%s)", indent, package, version, _current_depth, depth)
 
     # Check depth limit
     if _current_depth >= depth:
-        print(f"{indent}↳ Depth limit reached, skipping")
+        _LOG.debug("%s↳ Depth limit reached, skipping", indent)
         return {}
 
-    # Create unique identifier for this package version
-    pkg_id = f"{package}@{version}"
+    # Serve a recent stored tree instead of re-crawling the whole graph
+    if _current_depth == 0:
+        if _db is None:
+            _db = get_database()
+        cached = await _load_fresh_tree(_db, package, version, depth)
+        if cached is not None:
+            _LOG.info("Using stored dependency tree for %s@%s", package, version)
+            return cached
+
+    # Reuse the subtree if this node was already crawled (or is in flight).
+    # The key includes the remaining depth because that bounds the subtree;
+    # it strictly decreases along a path, so a node never awaits itself and
+    # dependency cycles terminate at the depth limit.
+    memo_key = f"{package}@{version}#{depth - _current_depth}"
+    future = _memo.get(memo_key)
+    if future is not None:
+        _LOG.debug("%s↳ Reusing crawl of %s@%s", indent, package, version)
+        return await future
+
+    future = asyncio.get_running_loop().create_future()
+    _memo[memo_key] = future
+    try:
+        result = await _fetch_npm_node(
+            package, version, depth, priority, _memo, _current_depth, _db, _npm_client, _package_repo, _enriched
+        )
+    except BaseException as e:
+        future.set_exception(e)
+        future.exception()  # Mark retrieved; other waiters still get the error
+        raise
 
-    # Prevent circular dependencies
-    if pkg_id in _visited:
-        print(f"{indent}↳ Already visited {pkg_id}, skipping")
-        return {}
+    future.set_result(result)
+    return result
 
-    _visited.add(pkg_id)
-    print(f"{indent}↳ Marked {pkg_id} as visited")
+
+async def _fetch_npm_node(
+    package: str,
+    version: str,
+    depth: int,
+    priority: Priority,
+    _memo: Dict[str, "asyncio.Future[Dict]"],
+    _current_depth: int,
+    _db,
+    _npm_client: NpmRegistryClient,
+    _package_repo: PackageRepository,
+    _enriched: Set[str],
+) -> Dict:
+    """
+    Fetch one dependency node and recurse into its children.
+
+    Args:
+        package: Package name
+        version: Package version
+        depth: Maximum recursion depth
+        _memo: Memo of crawled nodes shared across the tree crawl
+        _enriched: Package names already ensured in this crawl
+        _current_depth: Depth of this node
+
+    Returns:
+        Dictionary with package info and nested dependencies
+    """
+    indent = _indent(_current_depth)
 
     # Fetch version-specific metadata from npm registry using NpmRegistryClient with priority
     try:
-        print(f"{indent}↳ Requesting {package}@{version} via NpmRegistryClient (priority: {priority.name})")
-        data = await _npm_client.get_version_metadata(package, version, priority)
+        _LOG.debug("%s↳ Requesting %s@%s via NpmRegistryClient (priority: %s)", indent, package, version, priority.name)
+        async with _get_fetch_semaphore():
+            data = await _npm_client.get_version_metadata(package, version, priority)
 
         if not data:
             raise ValueError(f"Package '{package}@{version}' not found on npm registry")
 
-        print(f"{indent}✓ Successfully fetched {package}@{version}")
+        _LOG.debug("%s✓ Successfully fetched %s@%s", indent, package, version)
     except Exception as e:
-        print(f"{indent}✗ Failed to fetch {package}@{version}: {e}")
+        _LOG.warning("%s✗ Failed to fetch %s@%s: %s", indent, package, version, e)
         return {
             "error": str(e),
             "package": package,
@@ -83,8 +229,11 @@ async def _fetch_npm_deps_internal(
         }
 
     # Create Package record for this dependency (if not exists) - marked as dependency
-    # This allows releases, maintainers, and deltas to be tracked
-    if _current_depth > 0:  # Only create packages for dependencies, not the root package
+    # This allows releases, maintainers, and deltas to be tracked. Enrichment
+    # covers every version of a package, so it runs once per name per crawl;
+    # the name is claimed before awaiting so concurrent arrivals skip it too.
+    if _current_depth > 0 and package not in _enriched:  # Only dependencies, not the root
+        _enriched.add(package)
         try:
             await get_or_create_package_with_enrichment(
                 package_name=package,
@@ -93,15 +242,17 @@ async def _fetch_npm_deps_internal(
                 priority=priority,  # Pass through priority
                 is_dependency=True,  # Mark as dependency so it's filtered from list view
             )
-            print(f"{indent}✓ Package record ensured for dependency {package}")
+            _LOG.debug("%s✓ Package record ensured for dependency %s", indent, package)
         except Exception as e:
             # Don't fail the dependency tree fetch if package creation fails
-            print(f"{indent}⚠ Warning: Failed to create package record for {package}: {e}")
+            _LOG.warning("%s⚠ Warning: Failed to create package record for %s: %s", indent, package, e)
 
     # Extract maintainers from npm data
-    maintainers = []
-    if "maintainers" in data and isinstance(data["maintainers"], list):
-        maintainers = [m.get("name") for m in data["maintainers"] if m.get("name")]
+    maintainers = [
+        name
+        for m in (data.get("maintainers") or ())
+        if isinstance(m, dict) and (name := m.get("name"))
+    ]
 
     # Extract dependency information
     result = {
@@ -115,75 +266,45 @@ async def _fetch_npm_deps_internal(
         "peerDependencies": {}
     }
 
-    # Collect all dependency fetch tasks
+    # Collect all dependency fetch tasks. Each section is pre-sized with
+    # dict.fromkeys (keeping package.json order) and its entries are created
+    # once here; only their children are filled in after the fetch.
     fetch_tasks = []
-    dep_info = []  # Store metadata about each dependency
-
-    # Process production dependencies
-    prod_deps = data.get("dependencies", {})
-    if prod_deps:
-        print(f"{indent}  → Processing {len(prod_deps)} production dependencies concurrently")
-    for dep_name, dep_version in prod_deps.items():
-        clean_version = dep_version.lstrip("^~>=<")
-        print(f"{indent}    • {dep_name}@{dep_version}")
-        fetch_tasks.append(
-            _fetch_npm_deps_internal(dep_name, clean_version, depth, priority, _visited, _current_depth + 1, _db, _npm_client, _package_repo)
-        )
-        dep_info.append(("dependencies", dep_name, dep_version, clean_version))
-
-    # Process dev dependencies
-    dev_deps = data.get("devDependencies", {})
-    if dev_deps:
-        print(f"{indent}  → Processing {len(dev_deps)} dev dependencies concurrently")
-    for dep_name, dep_version in dev_deps.items():
-        clean_version = dep_version.lstrip("^~>=<")
-        print(f"{indent}    • {dep_name}@{dep_version}")
-        fetch_tasks.append(
-            _fetch_npm_deps_internal(dep_name, clean_version, depth, priority, _visited, _current_depth + 1, _db, _npm_client, _package_repo)
-        )
-        dep_info.append(("devDependencies", dep_name, dep_version, clean_version))
-
-    # Process optional dependencies
-    opt_deps = data.get("optionalDependencies", {})
-    if opt_deps:
-        print(f"{indent}  → Processing {len(opt_deps)} optional dependencies concurrently")
-    for dep_name, dep_version in opt_deps.items():
-        clean_version = dep_version.lstrip("^~>=<")
-        print(f"{indent}    • {dep_name}@{dep_version}")
-        fetch_tasks.append(
-            _fetch_npm_deps_internal(dep_name, clean_version, depth, priority, _visited, _current_depth + 1, _db, _npm_client, _package_repo)
-        )
-        dep_info.append(("optionalDependencies", dep_name, dep_version, clean_version))
-
-    # Process peer dependencies
-    peer_deps = data.get("peerDependencies", {})
-    if peer_deps:
-        print(f"{indent}  → Processing {len(peer_deps)} peer dependencies concurrently")
-    for dep_name, dep_version in peer_deps.items():
-        clean_version = dep_version.lstrip("^~>=<")
-        print(f"{indent}    • {dep_name}@{dep_version}")
-        fetch_tasks.append(
-            _fetch_npm_deps_internal(dep_name, clean_version, depth, priority, _visited, _current_depth + 1, _db, _npm_client, _package_repo)
-        )
-        dep_info.append(("peerDependencies", dep_name, dep_version, clean_version))
-
-    # Fetch all dependencies concurrently
-    if fetch_tasks:
-        print(f"{indent}  → Fetching {len(fetch_tasks)} dependencies concurrently...")
-        children_results = await asyncio.gather(*fetch_tasks, return_exceptions=True)
-
-        # Map results back to the correct dependency types
-        for i, (dep_type, dep_name, dep_version, clean_version) in enumerate(dep_info):
-            child_result = children_results[i]
-            if isinstance(child_result, Exception):
-                print(f"{indent}    ✗ Error fetching {dep_name}: {child_result}")
-                child_result = {"error": str(child_result)}
-
-            result[dep_type][dep_name] = {
+    # Children of this node would sit at the depth limit and come back empty,
+    # so leaf edges get their empty children here without spawning a crawl
+    leaf_level = _current_depth + 1 >= depth
+
+    for dep_type in DEP_KINDS:
+        deps = data.get(dep_type)
+        if not deps:
+            continue
+        _LOG.debug("%s  → Processing %s %s concurrently", indent, len(deps), dep_type)
+        section = result[dep_type] = dict.fromkeys(deps)
+        for dep_name, dep_version in deps.items():
+            clean_version = dep_version.lstrip(RANGE_PREFIX_CHARS)
+            _LOG.debug("%s    • %s@%s", indent, dep_name, dep_version)
+            section[dep_name] = entry = {
                 "spec": dep_version,
                 "resolved_version": clean_version,
-                "children": child_result
+                "children": {} if leaf_level else None,
             }
+            if leaf_level:
+                continue
+            fetch_tasks.append(
+                _attach_child(
+                    entry,
+                    dep_name,
+                    _fetch_npm_deps_internal(dep_name, clean_version, depth, priority, _memo, _current_depth + 1, _db, _npm_client, _package_repo, _enriched),
+                    indent,
+                )
+            )
+
+    # Fetch all dependencies concurrently; each child's result is attached
+    # to its entry as soon as it finishes rather than after the slowest one
+    if fetch_tasks:
+        _LOG.debug("%s  → Fetching %s dependencies concurrently...", indent, len(fetch_tasks))
+        for finished in asyncio.as_completed(fetch_tasks):
+            await finished
 
     # Store in database (only at root level)
     if _current_depth == 0:
@@ -191,47 +312,48 @@ async def _fetch_npm_deps_internal(
             _db = get_database()
 
         result["fetched_at"] = datetime.now(timezone.utc)
-
-        # Upsert based on name and version
-        print(f"{indent}💾 Storing {package}@{version} in database...")
-        _db.dependency_trees.update_one(
-            {"name": package, "version": version},
-            {"$set": result},
-            upsert=True
-        )
-        print(f"{indent}✓ Stored in database")
-
-        # Update package scan_state to mark dependencies as crawled
-        print(f"{indent}💾 Updating package scan_state for {package}...")
-        _db.packages.update_one(
-            {"name": package},
-            {
-                "$set": {
+        result["crawl_depth"] = depth
+
+        # Upsert the tree (by name and version) and mark the package's
+        # dependencies as crawled. The two writes hit different collections,
+        # so they run concurrently off the event loop (BSON-encoding a large
+        # tree included) rather than as one bulk_write. The package write
+        # goes through the repository so its ID and name caches are refreshed.
+        _LOG.info("%s💾 Storing %s@%s and updating scan_state...", indent, package, version)
+        await asyncio.gather(
+            asyncio.to_thread(
+                _db.dependency_trees.update_one,
+                {"name": package, "version": version},
+                {"$set": result},
+                upsert=True,
+            ),
+            _package_repo.update_one(
+                {"name": package},
+                {
                     "scan_state.deps_crawled": True,
                     "scan_state.crawl_depth": depth,
-                }
-            }
+                },
+            ),
         )
-        print(f"{indent}✓ Updated package scan_state")
+        _LOG.info("%s✓ Stored tree and updated package scan_state", indent)
 
         # Trigger threat assessment generation after dependencies are scanned
         try:
             # Import here to avoid circular imports
-            from services.ai_threat_surface_service import AIThreatSurfaceService
+            from services.ai_threat_surface_service import get_threat_surface_service
 
-            # Check if OpenRouter API key is available
-            OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
-            if OPENROUTER_API_KEY:
-                print(f"{indent}🔍 Triggering threat assessment for {package}...")
-                threat_service = AIThreatSurfaceService(_db, OPENROUTER_API_KEY)
+            # Shared service; None when no OpenRouter API key is configured
+            threat_service = get_threat_surface_service()
+            if threat_service:
+                _LOG.info("%s🔍 Triggering threat assessment for %s...", indent, package)
                 asyncio.create_task(threat_service.generate_assessment_for_package(package))
-                print(f"{indent}✓ Threat assessment task started")
+                _LOG.info("%s✓ Threat assessment task started", indent)
             else:
-                print(f"{indent}⚠️  OpenRouter API key not found, skipping threat assessment")
+                _LOG.info("%s⚠️  OpenRouter API key not found, skipping threat assessment", indent)
         except Exception as e:
-            print(f"{indent}⚠️  Failed to trigger threat assessment: {e}")
+            _LOG.warning("%s⚠️  Failed to trigger threat assessment: %s", indent, e)
 
-    print(f"{indent}✓ Completed {package}@{version}")
+    _LOG.debug("%s✓ Completed %s@%s", indent, package, version)
     return result
 
 
@@ -264,6 +386,80 @@ async def fetch_npm_deps(package: str, version: str, depth: int = 2) -> str:
     return job_id
 
 
+async def load_dependency_tree(package: str, version: str) -> Optional[Dict[str, Any]]:
+    """
+    Load a stored dependency tree without blocking the event loop.
+
+    Args:
+        package: Package name
+        version: Package version
+
+    Returns:
+        Dependency tree document (without _id) or None
+    """
+    db = get_database()
+    return await asyncio.to_thread(
+        db.dependency_trees.find_one,
+        {"name": package, "version": version},
+        {"_id": 0},
+    )
+
+
+async def ensure_dependency_tree_indexes() -> None:
+    """
+    Create the unique {name, version} index used by tree lookups and upserts.
+    """
+    db = get_database()
+    try:
+        await asyncio.to_thread(
+            db.dependency_trees.create_index,
+            [("name", 1), ("version", 1)],
+            unique=True,
+        )
+    except OperationFailure as e:
+        # Pre-existing duplicate trees block the unique index; don't fail startup
+        _LOG.warning("Could not create dependency_trees index: %s", e)
+
+
+# Comment line sent on idle job-status streams so proxies keep them open
+JOB_STREAM_HEARTBEAT_SECONDS = 15.0
+
+
+async def stream_job_status(job_id: str) -> AsyncIterator[bytes]:
+    """
+    Yield Server-Sent Events for a job until it completes or fails.
+
+    Emits a `status` event with the current job status immediately and on
+    every status/progress change, and a keep-alive comment while idle.
+
+    Args:
+        job_id: Job ID
+
+    Yields:
+        Encoded SSE frames
+    """
+    job_manager = get_job_manager()
+    last = None
+
+    while True:
+        changed = job_manager.watch(job_id)
+        status = get_deps_job_status(job_id)
+        if status is None:
+            return
+
+        if status != last:
+            yield b"event: status\ndata: " + orjson.dumps(status, default=str) + b"\n\n"
+            last = status
+
+        if status["status"] in (JobStatus.COMPLETED.value, JobStatus.FAILED.value):
+            return
+
+        try:
+            await asyncio.wait_for(changed.wait(), JOB_STREAM_HEARTBEAT_SECONDS)
+        except asyncio.TimeoutError:
+            yield b": keep-alive\n\n"
+
+
 def get_deps_job_status(job_id: str) -> Optional[Dict[str, Any]]:
     """
     Get status of a dependency fetch job.
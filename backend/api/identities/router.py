@@ -2,6 +2,7 @@
 Identity API router - expose maintainer/GitHub data.
 """
 
+from functools import lru_cache
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -16,11 +17,16 @@ router = APIRouter(
 )
 
 
-def get_identity_repository() -> IdentityRepository:
-    """Dependency injection for IdentityRepository."""
+@lru_cache
+def _identity_repository() -> IdentityRepository:
     return IdentityRepository(get_database())
 
 
+async def get_identity_repository() -> IdentityRepository:
+    """Dependency injection for IdentityRepository."""
+    return _identity_repository()
+
+
 @router.get("/", response_model=List[Identity])
 async def list_identities(
     skip: int = Query(0, ge=0, description="Number to skip"),
@@ -2,10 +2,13 @@
 Package API router.
 """
 
+import asyncio
+from functools import lru_cache
 from typing import Optional, List
 from urllib.parse import unquote
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 
 from api.packages.schemas import CreatePackageRequest, ListPackagesResponse, PackageWithLatestRelease, FetchMaintainersResponse
 from api.packages.service import create_package_from_npm, fetch_package_maintainers
@@ -15,7 +18,7 @@ from models.identity import Identity
 from repositories.package import PackageRepository
 from repositories.package_release import PackageReleaseRepository
 from repositories.identity import IdentityRepository
-from services.npm_client import NpmRegistryClient
+from services.npm_client import NpmRegistryClient, get_npm_client
 from services.priority_resource_manager import Priority
 
 router = APIRouter(
@@ -24,34 +27,45 @@ router = APIRouter(
 )
 
 
-def get_npm_client() -> NpmRegistryClient:
-    """
-    Dependency injection for NpmRegistryClient.
-
-    Returns the singleton NpmRegistryClient instance.
-    """
-    return NpmRegistryClient()  # Singleton pattern handles single instance
+@lru_cache
+def _package_repository() -> PackageRepository:
+    return PackageRepository(get_database())
 
 
-def get_package_repository() -> PackageRepository:
+async def get_package_repository() -> PackageRepository:
     """Dependency injection for PackageRepository."""
-    return PackageRepository(get_database())
+    return _package_repository()
 
 
-def get_package_release_repository() -> PackageReleaseRepository:
-    """Dependency injection for PackageReleaseRepository."""
+@lru_cache
+def _package_release_repository() -> PackageReleaseRepository:
     return PackageReleaseRepository(get_database())
 
 
-def get_identity_repository() -> IdentityRepository:
-    """Dependency injection for IdentityRepository."""
+async def get_package_release_repository() -> PackageReleaseRepository:
+    """Dependency injection for PackageReleaseRepository."""
+    return _package_release_repository()
+
+
+@lru_cache
+def _identity_repository() -> IdentityRepository:
     return IdentityRepository(get_database())
 
 
+async def get_identity_repository() -> IdentityRepository:
+    """Dependency injection for IdentityRepository."""
+    return _identity_repository()
+
+
+async def get_registry_client() -> NpmRegistryClient:
+    """Dependency injection for the shared NpmRegistryClient."""
+    return get_npm_client()
+
+
 @router.post("/", response_model=Package, status_code=201)
 async def create_package(
     request: CreatePackageRequest,
-    npm_client: NpmRegistryClient = Depends(get_npm_client),
+    npm_client: NpmRegistryClient = Depends(get_registry_client),
     repo: PackageRepository = Depends(get_package_repository),
 ):
     """
@@ -69,61 +83,41 @@ async def create_package(
     return package
 
 
-@router.get("/", response_model=ListPackagesResponse)
+@router.get("/", response_model=None, responses={200: {"model": ListPackagesResponse}})
 async def list_packages(
     skip: int = Query(0, ge=0, description="Number of packages to skip"),
     limit: int = Query(20, ge=1, le=100, description="Maximum packages to return"),
-    search: Optional[str] = Query(None, description="Search by package name"),
+    search: Optional[str] = Query(None, description="Search by package name or scope prefix"),
     repo: PackageRepository = Depends(get_package_repository),
-    release_repo: PackageReleaseRepository = Depends(get_package_release_repository),
 ):
     """
     List packages with pagination and optional search.
 
-    Search is case-insensitive and matches package names.
+    Search is case-insensitive and matches the start of package names or
+    scopes, so "babel" finds both "babel-core" and "@babel/core".
     """
-    # Filter out dependency packages - only show manually added packages
-    base_filter = {"is_dependency": {"$ne": True}}
-    
-    if search:
-        # Search by name, excluding dependencies
-        search_filter = {**base_filter, "name": {"$regex": search, "$options": "i"}}
-        packages = await repo.find_many(search_filter, skip=skip, limit=limit)
-        total = await repo.count(search_filter)
-    else:
-        # List all manually added packages
-        packages = await repo.find_many(base_filter, skip=skip, limit=limit)
-        total = await repo.count(base_filter)
-
-    # Enrich packages with latest release info
-    enriched_packages = []
-    for package in packages:
-        package_dict = package.model_dump()
-
-        if package.id:
-            releases = await release_repo.find_by_package(package.id, skip=0, limit=1)
-            latest_release = releases[0] if releases else None
-            package_dict["latest_release_date"] = latest_release.publish_timestamp if latest_release else None
-            package_dict["latest_release_version"] = latest_release.version if latest_release else None
-        else:
-            package_dict["latest_release_date"] = None
-            package_dict["latest_release_version"] = None
-        
-        enriched_packages.append(package_dict)
-
-    return ListPackagesResponse(
-        packages=enriched_packages,
-        total=total,
-        skip=skip,
-        limit=limit,
+    # Filter out dependency packages - only show manually added packages.
+    # The page (with each package's latest release) and the total are
+    # fetched concurrently.
+    package_docs, total = await repo.list_with_latest_release(
+        search, {"is_dependency": {"$ne": True}}, skip=skip, limit=limit
+    )
+
+    # Rows come back response-shaped, so they are encoded as-is rather than
+    # validated into models and re-encoded
+    return ORJSONResponse(
+        {
+            "packages": package_docs,
+            "total": total,
+            "skip": skip,
+            "limit": limit,
+        }
     )
 
 
 @router.get("/{name:path}/maintainers", response_model=List[Identity])
 async def get_package_maintainers(
     name: str,
-    package_repo: PackageRepository = Depends(get_package_repository),
-    release_repo: PackageReleaseRepository = Depends(get_package_release_repository),
     identity_repo: IdentityRepository = Depends(get_identity_repository),
 ):
     """
@@ -133,39 +127,20 @@ async def get_package_maintainers(
     """
     # URL-decode to handle scoped packages
     name = unquote(name)
-    
-    # Get package
-    package = await package_repo.find_by_name(name)
-    if not package:
-        raise HTTPException(status_code=404, detail=f"Package '{name}' not found")
-
-    if not package.id:
-        raise HTTPException(status_code=500, detail="Package ID is missing")
 
-    # Get all releases for this package
-    releases = await release_repo.find_by_package(package.id, skip=0, limit=1000)
-
-    # Collect unique identity IDs
-    identity_ids = set()
-    for release in releases:
-        if release.published_by:
-            identity_ids.add(release.published_by)
-
-    # Fetch identities
-    identities = []
-    for identity_id in identity_ids:
-        identity = await identity_repo.find_by_id(str(identity_id))
-        if identity:
-            identities.append(identity)
+    # Package, its distinct publishers and their identities in one aggregation
+    maintainers = await identity_repo.find_publishers_of_package(name)
+    if maintainers is None:
+        raise HTTPException(status_code=404, detail=f"Package '{name}' not found")
 
-    return identities
+    return maintainers
 
 
 @router.post("/{name:path}/fetch-maintainers", response_model=FetchMaintainersResponse)
 async def fetch_maintainers(
     name: str,
     package_repo: PackageRepository = Depends(get_package_repository),
-    npm_client: NpmRegistryClient = Depends(get_npm_client),
+    npm_client: NpmRegistryClient = Depends(get_registry_client),
 ):
     """
     Trigger maintainer crawling for a package (non-blocking).
@@ -239,11 +214,12 @@ async def delete_package(
     if not package.id:
         raise HTTPException(status_code=500, detail="Package ID is missing")
 
-    # Delete all releases for this package
-    await release_repo.delete_many({"package_id": package.id})
-
-    # Delete the package itself
-    deleted = await package_repo.delete(package.id)
+    # Delete the package and all its releases concurrently; nothing reads
+    # the package row once its ID is known
+    _, deleted = await asyncio.gather(
+        release_repo.delete_many({"package_id": package.id}),
+        package_repo.delete(package.id),
+    )
     if not deleted:
         raise HTTPException(status_code=500, detail="Failed to delete package")
 
@@ -254,7 +230,6 @@ async def delete_package(
 async def get_package(
     name: str,
     repo: PackageRepository = Depends(get_package_repository),
-    release_repo: PackageReleaseRepository = Depends(get_package_release_repository),
 ):
     """
     Get package details by name with latest release information.
@@ -264,20 +239,9 @@ async def get_package(
     # URL-decode to handle scoped packages
     name = unquote(name)
     
-    package = await repo.find_by_name(name)
-    if not package:
+    # Package and its most recent release come back from one aggregation
+    package_doc = await repo.find_by_name_with_latest_release(name)
+    if not package_doc:
         raise HTTPException(status_code=404, detail=f"Package '{name}' not found")
 
-    # Get the most recent release for this package
-    latest_release = None
-    if package.id:
-        releases = await release_repo.find_by_package(package.id, skip=0, limit=1)
-        if releases:
-            latest_release = releases[0]
-
-    # Create response with latest release info
-    package_dict = package.model_dump()
-    package_dict["latest_release_date"] = latest_release.publish_timestamp if latest_release else None
-    package_dict["latest_release_version"] = latest_release.version if latest_release else None
-
-    return PackageWithLatestRelease(**package_dict)
+    return PackageWithLatestRelease(**package_doc)
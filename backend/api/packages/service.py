@@ -2,7 +2,8 @@
 Package API service layer - business logic for package API operations.
 """
 
-import asyncio
+import os
+
 from fastapi import HTTPException
 
 from repositories.package import PackageRepository
@@ -14,6 +15,10 @@ from services.watcher import WatcherService
 from models.package import Package
 from database import get_database
 
+# Upper bound on initial analyses running at once; bursts of new packages
+# queue as pending jobs instead of all hitting npm and MongoDB together
+INITIAL_ANALYSIS_CONCURRENCY = int(os.getenv("INITIAL_ANALYSIS_CONCURRENCY", "4"))
+
 
 async def create_package_from_npm(
     package_name: str,
@@ -58,26 +63,39 @@ async def create_package_from_npm(
             detail=f"Package '{package_name}' not found on npm registry",
         )
 
-    # Trigger automatic analysis for newly created package (non-blocking)
-    asyncio.create_task(_trigger_package_analysis(package))
+    # Trigger automatic analysis for newly created package as a tracked,
+    # concurrency-bounded background job (non-blocking)
+    job_manager = get_job_manager()
+    job_id = job_manager.create_job(
+        job_type="initial_analysis",
+        metadata={"package_name": package.name},
+    )
+    job_manager.start_job(
+        job_id,
+        _trigger_package_analysis(package),
+        max_concurrent=INITIAL_ANALYSIS_CONCURRENCY,
+    )
 
     return package
 
 
 async def _trigger_package_analysis(package: Package):
     """
-    Background task to trigger initial analysis for a newly created package.
+    Background job running the initial analysis for a newly created package.
+
+    Errors propagate so the job is recorded as failed.
 
     Args:
         package: Package to analyze
+
+    Returns:
+        Watcher processing result
     """
-    try:
-        db = get_database()
-        watcher = WatcherService(db)
-        result = await watcher.process_package(package)
-        print(f"[package_service] Initial analysis completed for {package.name}: {result}")
-    except Exception as e:
-        print(f"[package_service] ERROR: Failed to trigger analysis for {package.name}: {e}")
+    db = get_database()
+    watcher = WatcherService(db)
+    result = await watcher.process_package(package)
+    print(f"[package_service] Initial analysis completed for {package.name}: {result}")
+    return result
 
 
 async def fetch_package_maintainers(
@@ -0,0 +1,160 @@
+"""
+In-process response cache for hot, read-mostly GET endpoints.
+"""
+
+import re
+import time
+from typing import List, Optional, Tuple
+
+from cachetools import TLRUCache
+
+# (path pattern, TTL seconds, max-stale seconds) for each cached endpoint;
+# first match wins. Max-stale bounds how long the last good body may stand
+# in for a failing endpoint.
+CACHE_POLICIES: List[Tuple[re.Pattern, float, float]] = [
+    (re.compile(r"^/packages/?$"), 10, 300),  # list_packages
+    (re.compile(r"^/packages/.+"), 30, 600),  # get_package, get_package_maintainers
+    (re.compile(r"^/threat-surface/stats$"), 60, 900),
+    (re.compile(r"^/threat-surface/package/.+"), 15, 300),
+]
+
+RESPONSE_CACHE_MAX_ENTRIES = 2_000
+
+# Methods whose success invalidates cached responses in their path section
+INVALIDATING_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+STALE_HEADERS = [
+    (b"x-cache", b"stale"),
+    (b"warning", b'110 - "Response is Stale"'),
+]
+
+
+def _policy(path: str) -> Optional[Tuple[float, float]]:
+    for pattern, ttl, max_stale in CACHE_POLICIES:
+        if pattern.match(path):
+            return ttl, max_stale
+    return None
+
+
+def _path_section(path: str) -> str:
+    """First path segment, e.g. '/packages' for '/packages/express?x=1'."""
+    return "/" + path.split("?", 1)[0].lstrip("/").split("/", 1)[0]
+
+
+class ResponseCacheMiddleware:
+    """
+    ASGI middleware caching successful GET responses per CACHE_POLICIES.
+
+    Entries are keyed on path + query string and expire after their policy
+    TTL. Requests sending `Cache-Control: no-cache` bypass the cache. A
+    successful POST/PUT/PATCH/DELETE drops every cached entry in the same
+    path section (e.g. any write under /packages). When a cached endpoint
+    fails with a 5xx, the last known good body is served instead if it is
+    within the policy's max-stale window, marked with `X-Cache: stale` and
+    a `Warning` header.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._fresh: TLRUCache = TLRUCache(
+            maxsize=RESPONSE_CACHE_MAX_ENTRIES,
+            ttu=lambda _key, entry, now: now + entry[0],
+            timer=time.monotonic,
+        )
+        self._last_known: TLRUCache = TLRUCache(
+            maxsize=RESPONSE_CACHE_MAX_ENTRIES,
+            ttu=lambda _key, entry, now: now + entry[0],
+            timer=time.monotonic,
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        path = scope["path"]
+
+        if method in INVALIDATING_METHODS:
+            await self._call_and_invalidate(scope, receive, send, path)
+            return
+
+        policy = _policy(path) if method == "GET" else None
+        if policy is None:
+            await self.app(scope, receive, send)
+            return
+        ttl, max_stale = policy
+
+        key = f"{path}?{scope.get('query_string', b'').decode('latin-1')}"
+        headers = dict(scope.get("headers") or [])
+        bypass = b"no-cache" in headers.get(b"cache-control", b"")
+
+        if not bypass:
+            entry = self._fresh.get(key)
+            if entry is not None:
+                await self._replay(send, entry[1], entry[2])
+                return
+
+        start: dict = {}
+        chunks: List[bytes] = []
+
+        async def capture(message):
+            # Buffer the response so a 5xx can still be swapped for the
+            # last known body; cached endpoints return small JSON documents
+            if message["type"] == "http.response.start":
+                start.update(message)
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        try:
+            await self.app(scope, receive, capture)
+        except Exception:
+            stale = self._last_known.get(key)
+            if stale is None:
+                raise
+            await self._replay(send, stale[1] + STALE_HEADERS, stale[2])
+            return
+
+        status = start.get("status", 500)
+        response_headers = list(start.get("headers", []))
+        body = b"".join(chunks)
+
+        if status == 200:
+            self._fresh[key] = (ttl, response_headers, body)
+            self._last_known[key] = (max_stale, response_headers, body)
+        elif status >= 500 and (stale := self._last_known.get(key)) is not None:
+            response_headers, body = stale[1] + STALE_HEADERS, stale[2]
+            status = 200
+
+        await send({"type": "http.response.start", "status": status, "headers": response_headers})
+        await send({"type": "http.response.body", "body": body})
+
+    async def _call_and_invalidate(self, scope, receive, send, path: str) -> None:
+        status = 0
+
+        async def watch(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        await self.app(scope, receive, watch)
+
+        if 200 <= status < 300:
+            self.invalidate(_path_section(path))
+
+    def invalidate(self, section: str) -> None:
+        """
+        Drop all cached responses under a path section.
+
+        Args:
+            section: Leading path segment, e.g. '/packages'
+        """
+        for cache in (self._fresh, self._last_known):
+            for key in [k for k in list(cache.keys()) if _path_section(k) == section]:
+                cache.pop(key, None)
+
+    @staticmethod
+    async def _replay(send, headers: list, body: bytes) -> None:
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
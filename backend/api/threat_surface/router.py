@@ -3,12 +3,13 @@ Threat Surface API router.
 """
 
 import asyncio
-import os
+from functools import lru_cache
 from typing import List
 from urllib.parse import unquote
 
 from bson import ObjectId
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 
 from api.threat_surface.schemas import (
     AssessmentHistoryResponse,
@@ -18,10 +19,11 @@ from api.threat_surface.schemas import (
     ThreatSurfaceStatsResponse,
 )
 from database import get_database
+from models.package_threat_assessment import PackageThreatAssessment
 from repositories.package import PackageRepository
 from repositories.package_threat_assessment import PackageThreatAssessmentRepository
 from services.background_jobs import get_job_manager
-from services.ai_threat_surface_service import AIThreatSurfaceService
+from services.ai_threat_surface_service import get_threat_surface_service
 
 router = APIRouter(
     prefix="/threat-surface",
@@ -29,20 +31,54 @@ router = APIRouter(
 )
 
 
-def get_package_repository() -> PackageRepository:
-    """Dependency injection for PackageRepository."""
+@lru_cache
+def _package_repository() -> PackageRepository:
     return PackageRepository(get_database())
 
 
-def get_threat_assessment_repository() -> PackageThreatAssessmentRepository:
-    """Dependency injection for PackageThreatAssessmentRepository."""
+async def get_package_repository() -> PackageRepository:
+    """Dependency injection for PackageRepository."""
+    return _package_repository()
+
+
+@lru_cache
+def _threat_assessment_repository() -> PackageThreatAssessmentRepository:
     return PackageThreatAssessmentRepository(get_database())
 
 
+async def get_threat_assessment_repository() -> PackageThreatAssessmentRepository:
+    """Dependency injection for PackageThreatAssessmentRepository."""
+    return _threat_assessment_repository()
+
+
+def _assessment_row(assessment: PackageThreatAssessment, package_name: str) -> dict:
+    """
+    Build a ThreatAssessmentResponse-shaped dict enriched with package name.
+
+    The assessment was validated when loaded, so the dict is returned as-is
+    rather than re-validated through ThreatAssessmentResponse.
+
+    Args:
+        assessment: Stored assessment
+        package_name: Name of the assessed package
+
+    Returns:
+        JSON-ready assessment dict
+    """
+    assessment_dict = assessment.model_dump()
+    assessment_dict["id"] = str(assessment.id)
+    assessment_dict["package_id"] = str(assessment.package_id)
+    assessment_dict["package_name"] = package_name
+    if assessment.previous_assessment_id:
+        assessment_dict["previous_assessment_id"] = str(
+            assessment.previous_assessment_id
+        )
+    return assessment_dict
+
+
 @router.get("/package/{package_name}", response_model=CurrentAssessmentResponse)
 async def get_current_assessment(
     package_name: str,
-    package_repo: PackageRepository = Depends(get_package_repository),
     assessment_repo: PackageThreatAssessmentRepository = Depends(
         get_threat_assessment_repository
     ),
@@ -66,18 +102,15 @@ async def get_current_assessment(
     # URL-decode to handle scoped packages
     package_name = unquote(package_name)
 
-    # Get package
-    package = await package_repo.find_by_name(package_name)
-    if not package:
+    # Get package and its most recent assessment in one round trip
+    found = await assessment_repo.find_for_package_name(package_name, limit=1)
+    if found is None:
         raise HTTPException(
             status_code=404, detail=f"Package '{package_name}' not found"
         )
 
-    if not package.id:
-        raise HTTPException(status_code=500, detail="Package ID is missing")
-
-    # Get most recent assessment
-    assessment = await assessment_repo.find_current_by_package(package.id)
+    name, assessments = found
+    assessment = assessments[0] if assessments else None
 
     if not assessment:
         # No assessment exists yet - return not_generated status
@@ -90,31 +123,23 @@ async def get_current_assessment(
         )
 
     # Enrich response with package name
-    assessment_dict = assessment.model_dump()
-    assessment_dict["id"] = str(assessment.id)
-    assessment_dict["package_id"] = str(assessment.package_id)
-    assessment_dict["package_name"] = package.name
-    if assessment.previous_assessment_id:
-        assessment_dict["previous_assessment_id"] = str(
-            assessment.previous_assessment_id
-        )
-
     return CurrentAssessmentResponse(
         status="available",
-        assessment=ThreatAssessmentResponse(**assessment_dict),
+        assessment=ThreatAssessmentResponse(**_assessment_row(assessment, name)),
         message=None
     )
 
 
 @router.get(
-    "/package/{package_name}/history", response_model=AssessmentHistoryResponse
+    "/package/{package_name}/history",
+    response_model=None,
+    responses={200: {"model": AssessmentHistoryResponse}},
 )
 async def get_assessment_history(
     package_name: str,
     limit: int = Query(
         10, ge=1, le=100, description="Maximum number of assessments to return"
     ),
-    package_repo: PackageRepository = Depends(get_package_repository),
     assessment_repo: PackageThreatAssessmentRepository = Depends(
         get_threat_assessment_repository
     ),
@@ -129,7 +154,7 @@ async def get_assessment_history(
         limit: Maximum number of assessments to return (default 10, max 100)
 
     Returns:
-        AssessmentHistoryResponse with list of assessments
+        ORJSONResponse with assessments, total and package_name
 
     Example:
         GET /api/threat-surface/package/express/history?limit=20
@@ -137,47 +162,36 @@ async def get_assessment_history(
     # URL-decode to handle scoped packages
     package_name = unquote(package_name)
 
-    # Get package
-    package = await package_repo.find_by_name(package_name)
-    if not package:
+    # Get package and its historical assessments in one round trip
+    found = await assessment_repo.find_for_package_name(package_name, limit=limit)
+    if found is None:
         raise HTTPException(
             status_code=404, detail=f"Package '{package_name}' not found"
         )
 
-    if not package.id:
-        raise HTTPException(status_code=500, detail="Package ID is missing")
-
-    # Get historical assessments
-    assessments = await assessment_repo.find_by_package(package.id, limit=limit)
-
-    # Enrich each assessment with package name
-    enriched_assessments = []
-    for assessment in assessments:
-        assessment_dict = assessment.model_dump()
-        assessment_dict["id"] = str(assessment.id)
-        assessment_dict["package_id"] = str(assessment.package_id)
-        assessment_dict["package_name"] = package.name
-        if assessment.previous_assessment_id:
-            assessment_dict["previous_assessment_id"] = str(
-                assessment.previous_assessment_id
-            )
-        enriched_assessments.append(ThreatAssessmentResponse(**assessment_dict))
-
-    return AssessmentHistoryResponse(
-        assessments=enriched_assessments,
-        total=len(enriched_assessments),
-        package_name=package.name,
+    name, assessments = found
+
+    # Enrich each assessment with package name and encode the rows
+    # directly, skipping per-assessment response-model validation
+    enriched_assessments = [_assessment_row(assessment, name) for assessment in assessments]
+
+    return ORJSONResponse(
+        {
+            "assessments": enriched_assessments,
+            "total": len(enriched_assessments),
+            "package_name": name,
+        }
     )
 
 
 @router.get(
     "/package/{package_name}/version/{version}",
-    response_model=ThreatAssessmentResponse,
+    response_model=None,
+    responses={200: {"model": ThreatAssessmentResponse}},
 )
 async def get_assessment_by_version(
     package_name: str,
     version: str,
-    package_repo: PackageRepository = Depends(get_package_repository),
     assessment_repo: PackageThreatAssessmentRepository = Depends(
         get_threat_assessment_repository
     ),
@@ -192,7 +206,7 @@ async def get_assessment_by_version(
         version: Specific version string
 
     Returns:
-        ThreatAssessmentResponse for the specified version
+        ORJSONResponse with the ThreatAssessmentResponse for the version
 
     Example:
         GET /api/threat-surface/package/express/version/4.18.2
@@ -201,18 +215,17 @@ async def get_assessment_by_version(
     package_name = unquote(package_name)
     version = unquote(version)
 
-    # Get package
-    package = await package_repo.find_by_name(package_name)
-    if not package:
+    # Get package and the assessment for this version in one round trip
+    found = await assessment_repo.find_for_package_name(
+        package_name, {"version": version}, limit=1
+    )
+    if found is None:
         raise HTTPException(
             status_code=404, detail=f"Package '{package_name}' not found"
         )
 
-    if not package.id:
-        raise HTTPException(status_code=500, detail="Package ID is missing")
-
-    # Get assessment for specific version
-    assessment = await assessment_repo.find_by_version(package.id, version)
+    name, assessments = found
+    assessment = assessments[0] if assessments else None
     if not assessment:
         raise HTTPException(
             status_code=404,
@@ -220,16 +233,7 @@ async def get_assessment_by_version(
         )
 
     # Enrich response with package name
-    assessment_dict = assessment.model_dump()
-    assessment_dict["id"] = str(assessment.id)
-    assessment_dict["package_id"] = str(assessment.package_id)
-    assessment_dict["package_name"] = package.name
-    if assessment.previous_assessment_id:
-        assessment_dict["previous_assessment_id"] = str(
-            assessment.previous_assessment_id
-        )
-
-    return ThreatAssessmentResponse(**assessment_dict)
+    return ORJSONResponse(_assessment_row(assessment, name))
 
 
 @router.post(
@@ -275,6 +279,11 @@ async def generate_assessment(
             status_code=404, detail=f"Package '{package_name}' not found"
         )
 
+    # Fail fast rather than queueing a job that cannot run
+    threat_service = get_threat_surface_service()
+    if threat_service is None:
+        raise HTTPException(status_code=503, detail="OpenRouter API key not configured")
+
     # Create background job
     job_manager = get_job_manager()
     job_id = job_manager.create_job(
@@ -285,14 +294,6 @@ async def generate_assessment(
     # Define the assessment coroutine
     async def run_assessment():
         """Background task to generate threat assessment."""
-        # Check if OpenRouter API key is available
-        OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
-        if not OPENROUTER_API_KEY:
-            raise ValueError("OpenRouter API key not configured")
-
-        # Initialize service and generate assessment
-        db = get_database()
-        threat_service = AIThreatSurfaceService(db, OPENROUTER_API_KEY)
         assessment = await threat_service.generate_assessment_for_package(package_name)
 
         if not assessment:
@@ -347,17 +348,11 @@ async def get_threat_surface_stats(
             "packages_assessed": 120
         }
     """
-    # Get statistics from repository
+    # Risk-level counts and assessed packages in one $facet round trip
     stats = await assessment_repo.get_stats()
 
-    # Calculate unique packages assessed by counting distinct package_ids
-    db = get_database()
-    packages_assessed = len(
-        await db.package_threat_assessments.distinct("package_id")
-    )
-
     return ThreatSurfaceStatsResponse(
-        total_assessments=stats.get("total", 0),
-        by_risk_level=stats.get("by_risk_level", {}),
-        packages_assessed=packages_assessed,
+        total_assessments=stats["total"],
+        by_risk_level=stats["by_risk_level"],
+        packages_assessed=stats["packages_assessed"],
     )
@@ -5,7 +5,7 @@ Threat Surface API request/response schemas.
 from datetime import datetime
 from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ThreatAssessmentResponse(BaseModel):
@@ -52,8 +52,8 @@ class ThreatAssessmentResponse(BaseModel):
         default=None, description="Reference to previous assessment for comparison"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "507f1f77bcf86cd799439011",
                 "package_id": "507f1f77bcf86cd799439010",
@@ -81,6 +81,7 @@ class ThreatAssessmentResponse(BaseModel):
                 "previous_assessment_id": None,
             }
         }
+    )
 
 
 class AssessmentHistoryResponse(BaseModel):
@@ -94,14 +95,15 @@ class AssessmentHistoryResponse(BaseModel):
     total: int = Field(..., description="Total number of assessments")
     package_name: str = Field(..., description="Package name")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "assessments": [],
                 "total": 5,
                 "package_name": "express",
             }
         }
+    )
 
 
 class ThreatSurfaceStatsResponse(BaseModel):
@@ -117,14 +119,15 @@ class ThreatSurfaceStatsResponse(BaseModel):
         ..., description="Number of unique packages assessed"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "total_assessments": 150,
                 "by_risk_level": {"low": 80, "medium": 50, "high": 15, "critical": 5},
                 "packages_assessed": 120,
             }
         }
+    )
 
 
 class CurrentAssessmentResponse(BaseModel):
@@ -143,8 +146,8 @@ class CurrentAssessmentResponse(BaseModel):
         default=None, description="Human-readable message"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "status": "available",
                 "assessment": {
@@ -156,6 +159,7 @@ class CurrentAssessmentResponse(BaseModel):
                 "message": None,
             }
         }
+    )
 
 
 class GenerateAssessmentResponse(BaseModel):
@@ -168,8 +172,8 @@ class GenerateAssessmentResponse(BaseModel):
     message: str = Field(..., description="Human-readable message")
     package_name: str = Field(..., description="Package name")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "job_id": "abc-123-def-456",
                 "status": "pending",
@@ -177,3 +181,4 @@ class GenerateAssessmentResponse(BaseModel):
                 "package_name": "express",
             }
         }
+    )
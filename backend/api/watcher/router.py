@@ -2,9 +2,11 @@
 API endpoints for watcher status.
 """
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel
-from typing import Optional
+from typing import Optional, Tuple
 
 from services.scheduler import WatcherScheduler
 
@@ -16,8 +18,12 @@ router = APIRouter(
 # Singleton scheduler instance (initialized on app startup)
 _scheduler: Optional[WatcherScheduler] = None
 
+# (scheduler state_version, encoded status) of the last /status response;
+# dashboards poll it far more often than the scheduler state changes
+_status_body: Tuple[int, bytes] = (-1, b"")
 
-def get_scheduler() -> WatcherScheduler:
+
+async def get_scheduler() -> WatcherScheduler:
     """Get the scheduler instance."""
     if _scheduler is None:
         raise HTTPException(status_code=503, detail="Watcher scheduler not initialized")
@@ -26,8 +32,9 @@ def get_scheduler() -> WatcherScheduler:
 
 def init_scheduler(database) -> WatcherScheduler:
     """Initialize the scheduler (called from main.py startup)."""
-    global _scheduler
+    global _scheduler, _status_body
     _scheduler = WatcherScheduler(database)
+    _status_body = (-1, b"")
     return _scheduler
 
 
@@ -55,13 +62,27 @@ class PauseResponse(BaseModel):
     is_paused: bool
 
 
-@router.get("/status", response_model=StatusResponse)
+def _pause_payload(success: bool, message: str, is_paused: bool) -> ORJSONResponse:
+    """Build a PauseResponse-shaped response without model validation."""
+    return ORJSONResponse(
+        {"success": success, "message": message, "is_paused": is_paused}
+    )
+
+
+@router.get("/status", response_model=None, responses={200: {"model": StatusResponse}})
 async def get_status(scheduler: WatcherScheduler = Depends(get_scheduler)):
     """Get current watcher status."""
-    return scheduler.get_status()
+    global _status_body
+    version, body = _status_body
+    if version != scheduler.state_version:
+        version = scheduler.state_version
+        # get_status() already returns a flat, JSON-ready dict
+        body = orjson.dumps(scheduler.get_status())
+        _status_body = (version, body)
+    return Response(content=body, media_type="application/json")
 
 
-@router.post("/pause", response_model=PauseResponse)
+@router.post("/pause", response_model=None, responses={200: {"model": PauseResponse}})
 async def pause_watcher(scheduler: WatcherScheduler = Depends(get_scheduler)):
     """
     Pause all background processes including:
@@ -75,20 +96,12 @@ async def pause_watcher(scheduler: WatcherScheduler = Depends(get_scheduler)):
     success = scheduler.pause()
 
     if success:
-        return PauseResponse(
-            success=True,
-            message="All background processes paused",
-            is_paused=True
-        )
+        return _pause_payload(True, "All background processes paused", is_paused=True)
     else:
-        return PauseResponse(
-            success=False,
-            message="Watcher is not running",
-            is_paused=False
-        )
+        return _pause_payload(False, "Watcher is not running", is_paused=False)
 
 
-@router.post("/resume", response_model=PauseResponse)
+@router.post("/resume", response_model=None, responses={200: {"model": PauseResponse}})
 async def resume_watcher(scheduler: WatcherScheduler = Depends(get_scheduler)):
     """
     Resume all background processes.
@@ -101,17 +114,9 @@ async def resume_watcher(scheduler: WatcherScheduler = Depends(get_scheduler)):
     success = scheduler.resume()
 
     if success:
-        return PauseResponse(
-            success=True,
-            message="All background processes resumed",
-            is_paused=False
-        )
+        return _pause_payload(True, "All background processes resumed", is_paused=False)
     else:
-        return PauseResponse(
-            success=False,
-            message="Watcher is not running",
-            is_paused=False
-        )
+        return _pause_payload(False, "Watcher is not running", is_paused=False)
 
 
 @router.post("/trigger")
@@ -123,8 +128,8 @@ async def trigger_poll(scheduler: WatcherScheduler = Depends(get_scheduler)):
     Useful for testing or forcing an update.
     """
     result = await scheduler.trigger_now()
-    return {
+    return ORJSONResponse({
         "success": True,
         "message": "Poll triggered successfully",
         "result": result
-    }
+    })
@@ -1,44 +1,127 @@
 """
 Backfill maintainer information into existing dependency trees.
 """
-import requests
+import os
+import shelve
+import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Dict, Iterator, Optional, Set
+
+import httpx
+import orjson
+from pymongo import UpdateOne
+
 from database import get_database, get_database_manager
 
-def fetch_maintainers_from_npm(package_name: str) -> list:
-    """Fetch maintainers for a package from npm registry."""
+DEP_TYPES = ("dependencies", "devDependencies", "optionalDependencies", "peerDependencies")
+
+# Parallel registry lookups; the work is pure network I/O
+FETCH_CONCURRENCY = 64
+
+# Tree updates sent per bulk_write round-trip
+WRITE_BATCH_SIZE = 1000
+
+# Maintainer lists fetched today are reused across script runs
+MAINTAINER_CACHE_PATH = os.getenv(
+    "MAINTAINER_CACHE_PATH", os.path.join(tempfile.gettempdir(), "npm_maintainers")
+)
+
+# One keep-alive HTTP/2 client shared by all worker threads, so lookups
+# multiplex over a few connections instead of a TLS handshake each
+_client = httpx.Client(
+    http2=True,
+    timeout=10,
+    limits=httpx.Limits(
+        max_connections=FETCH_CONCURRENCY, max_keepalive_connections=FETCH_CONCURRENCY
+    ),
+)
+
+
+def fetch_maintainers_from_npm(package_name: str) -> Optional[list]:
+    """
+    Fetch maintainers for a package from npm registry.
+
+    Returns None when the registry could not be read, so failures are not
+    cached as "no maintainers".
+    """
     try:
         url = f"https://registry.npmjs.org/{package_name}"
-        response = requests.get(url, timeout=10)
+        response = _client.get(url)
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             if "maintainers" in data and isinstance(data["maintainers"], list):
                 return [m.get("name") for m in data["maintainers"] if m.get("name")]
+            return []
+        if response.status_code == 404:
+            return []
     except Exception as e:
         print(f"  ✗ Error fetching {package_name}: {e}")
-    return []
+    return None
 
-def add_maintainers_to_node(node: dict, indent: str = "") -> dict:
+
+def fetch_all_maintainers(package_names: Set[str]) -> Dict[str, list]:
     """
-    Recursively add maintainer information to a dependency node.
+    Fetch maintainers for many packages concurrently.
+
+    Packages already fetched today (by an earlier run) are served from the
+    on-disk cache at MAINTAINER_CACHE_PATH; only the rest hit the registry.
+
+    Args:
+        package_names: Unique package names to look up
+
+    Returns:
+        Mapping of package name to maintainer usernames. Packages whose
+        registry fetch failed are left out, so they stay unfilled and are
+        retried on the next run.
     """
-    if not isinstance(node, dict):
-        return node
+    today = date.today().isoformat()
+    maintainers_by_name: Dict[str, list] = {}
+
+    # The shelf is only touched from this thread; workers just do HTTP
+    with shelve.open(MAINTAINER_CACHE_PATH) as cache:
+        to_fetch = []
+        for name in sorted(package_names):
+            cached = cache.get(name)
+            if cached and cached[0] == today:
+                maintainers_by_name[name] = cached[1]
+            else:
+                to_fetch.append(name)
+
+        print(f"  {len(maintainers_by_name)} cached, {len(to_fetch)} to fetch")
+
+        with ThreadPoolExecutor(max_workers=FETCH_CONCURRENCY) as pool:
+            for name, maintainers in zip(to_fetch, pool.map(fetch_maintainers_from_npm, to_fetch)):
+                if maintainers is not None:
+                    maintainers_by_name[name] = maintainers
+                    cache[name] = (today, maintainers)
 
-    # If this node has a name, fetch its maintainers
-    if "name" in node and "maintainers" not in node:
-        package_name = node["name"]
-        maintainers = fetch_maintainers_from_npm(package_name)
-        node["maintainers"] = maintainers
-        print(f"{indent}✓ {package_name}: {len(maintainers)} maintainers")
+    return maintainers_by_name
 
-    # Recursively process children
-    for dep_type in ["dependencies", "devDependencies", "optionalDependencies", "peerDependencies"]:
-        if dep_type in node and isinstance(node[dep_type], dict):
-            for dep_name, dep_data in node[dep_type].items():
-                if "children" in dep_data and isinstance(dep_data["children"], dict):
-                    add_maintainers_to_node(dep_data["children"], indent + "  ")
 
-    return node
+def iter_child_nodes(node: dict) -> Iterator[dict]:
+    """Yield the `children` nodes of every dependency entry under a node."""
+    for dep_type in DEP_TYPES:
+        if isinstance(deps := node.get(dep_type), dict):
+            for dep_data in deps.values():
+                if isinstance(children := dep_data.get("children"), dict):
+                    yield children
+
+
+def walk_nodes(tree: dict) -> Iterator[dict]:
+    """
+    Yield a tree and every nested `children` node, breadth first.
+
+    Uses an explicit queue so arbitrarily deep trees cannot hit the
+    recursion limit.
+    """
+    queue = deque([tree])
+    while queue:
+        node = queue.popleft()
+        yield node
+        queue.extend(iter_child_nodes(node))
+
 
 def main():
     # Connect to database
@@ -48,45 +131,66 @@ def main():
     db = get_database()
 
     # Get all dependency trees
-    trees = list(db.dependency_trees.find({}))
+    # Only the fields the backfill reads or rewrites
+    projection = {"name": 1, "version": 1, "maintainers": 1, **{dep_type: 1 for dep_type in DEP_TYPES}}
+    trees = list(db.dependency_trees.find({}, projection))
 
     print(f"\n{'='*60}")
     print(f"BACKFILLING MAINTAINER DATA IN DEPENDENCY TREES")
     print(f"{'='*60}\n")
     print(f"Found {len(trees)} dependency trees\n")
 
+    # Walk every tree once, then fetch each unique package a single time
+    # rather than once per occurrence
+    missing_by_tree = []
     for tree in trees:
+        missing_by_tree.append([
+            node for node in walk_nodes(tree)
+            if "name" in node and "maintainers" not in node
+        ])
+
+    names = {node["name"] for missing in missing_by_tree for node in missing}
+    print(f"Fetching maintainers for {len(names)} unique packages...")
+    maintainers_by_name = fetch_all_maintainers(names)
+
+    ops = []
+    for tree, missing in zip(trees, missing_by_tree):
         tree_name = tree.get("name")
         tree_version = tree.get("version")
         print(f"\nProcessing: {tree_name}@{tree_version}")
-        print(f"{'='*40}")
-
-        # Add maintainers to root level
-        if "maintainers" not in tree:
-            maintainers = fetch_maintainers_from_npm(tree_name)
-            tree["maintainers"] = maintainers
-            print(f"Root: {len(maintainers)} maintainers")
-
-        # Process all dependency types
-        for dep_type in ["dependencies", "devDependencies", "optionalDependencies", "peerDependencies"]:
-            if dep_type in tree and isinstance(tree[dep_type], dict):
-                print(f"\n{dep_type}:")
-                for dep_name, dep_data in tree[dep_type].items():
-                    if "children" in dep_data and isinstance(dep_data["children"], dict):
-                        add_maintainers_to_node(dep_data["children"], "  ")
-
-        # Update the tree in database
-        db.dependency_trees.update_one(
-            {"_id": tree["_id"]},
-            {"$set": tree}
+
+        filled = 0
+        for node in missing:
+            maintainers = maintainers_by_name.get(node["name"])
+            if maintainers is None:
+                print(f"  - {node['name']}: fetch failed, skipping")
+                continue
+            node["maintainers"] = maintainers
+            filled += 1
+            print(f"  ✓ {node['name']}: {len(maintainers)} maintainers")
+
+        if not filled:
+            continue
+
+        # Only rewrite the fields the backfill touched
+        updates = {dep_type: tree[dep_type] for dep_type in DEP_TYPES if dep_type in tree}
+        if "maintainers" in tree:
+            updates["maintainers"] = tree["maintainers"]
+        ops.append(UpdateOne({"_id": tree["_id"]}, {"$set": updates}))
+
+    # Update the trees in database
+    for start in range(0, len(ops), WRITE_BATCH_SIZE):
+        result = db.dependency_trees.bulk_write(
+            ops[start:start + WRITE_BATCH_SIZE], ordered=False
         )
-        print(f"\n✓ Updated {tree_name}@{tree_version} in database")
+        print(f"✓ Updated {result.modified_count} dependency trees in database")
 
     print(f"\n{'='*60}")
     print(f"COMPLETE")
     print(f"{'='*60}\n")
 
     # Disconnect from database
+    _client.close()
     db_manager.disconnect()
 
 if __name__ == "__main__":
@@ -7,6 +7,32 @@ from services.npm_client import NpmRegistryClient
 from repositories.package import PackageRepository
 from services.package_service import get_or_create_package_with_enrichment
 
+# Packages created at once; each creation also does GitHub enrichment and
+# Mongo writes, which the npm client's slots do not cover
+BACKFILL_CONCURRENCY = 32
+
+DEP_TYPES = ('dependencies', 'devDependencies', 'optionalDependencies', 'peerDependencies')
+
+# Only the direct dependency names of each tree are needed, so reduce each
+# dependency map to its keys server-side instead of decoding nested children
+TREE_DEP_NAMES_PIPELINE = [
+    {
+        "$project": {
+            "name": 1,
+            "version": 1,
+            **{
+                dep_type: {
+                    "$map": {
+                        "input": {"$objectToArray": {"$ifNull": [f"${dep_type}", {}]}},
+                        "in": "$$this.k",
+                    }
+                }
+                for dep_type in DEP_TYPES
+            },
+        }
+    }
+]
+
 async def main():
     # Connect to database
     db_manager = get_database_manager()
@@ -17,7 +43,7 @@ async def main():
     npm_client = NpmRegistryClient()
 
     # Get all dependency trees
-    dep_trees = list(db.dependency_trees.find({}))
+    dep_trees = list(db.dependency_trees.aggregate(TREE_DEP_NAMES_PIPELINE))
 
     print(f"\n{'='*60}")
     print(f"BACKFILLING PACKAGE RECORDS FROM DEPENDENCY TREES")
@@ -31,44 +57,52 @@ async def main():
         print(f"Processing tree: {tree.get('name')}@{tree.get('version')}")
 
         # Extract all dependency names
-        for dep_type in ['dependencies', 'devDependencies', 'optionalDependencies', 'peerDependencies']:
-            deps = tree.get(dep_type, {})
-            for dep_name in deps.keys():
-                all_dep_names.add(dep_name)
+        for dep_type in DEP_TYPES:
+            all_dep_names.update(tree.get(dep_type, []))
 
     print(f"\n✓ Found {len(all_dep_names)} unique dependencies across all trees\n")
 
     # Process each unique dependency
-    created_count = 0
     skipped_count = 0
-    error_count = 0
 
-    for dep_name in sorted(all_dep_names):
-        # Check if package already exists
-        existing = package_repo.find_by_name(dep_name)
-        if existing:
-            print(f"⊘ {dep_name} - Already exists")
-            skipped_count += 1
-            continue
+    # Look up every existing package in one $in query
+    existing_names = {pkg.name for pkg in await package_repo.find_by_names(all_dep_names)}
 
-        # Create package with enrichment
+    semaphore = asyncio.Semaphore(BACKFILL_CONCURRENCY)
+
+    async def create_package(dep_name: str) -> bool:
+        """Create and enrich one missing package; True if it was created."""
         try:
-            print(f"→ Creating package for {dep_name}...")
-            pkg = await get_or_create_package_with_enrichment(
-                package_name=dep_name,
-                npm_client=npm_client,
-                repo=package_repo,
-            )
+            async with semaphore:
+                print(f"→ Creating package for {dep_name}...")
+                pkg = await get_or_create_package_with_enrichment(
+                    package_name=dep_name,
+                    npm_client=npm_client,
+                    repo=package_repo,
+                )
 
             if pkg:
                 print(f"✓ {dep_name} - Created with maintainers")
-                created_count += 1
-            else:
-                print(f"✗ {dep_name} - Not found on npm")
-                error_count += 1
+                return True
+            print(f"✗ {dep_name} - Not found on npm")
         except Exception as e:
             print(f"✗ {dep_name} - Error: {e}")
-            error_count += 1
+        return False
+
+    to_create = []
+    for dep_name in sorted(all_dep_names):
+        # Check if package already exists
+        if dep_name in existing_names:
+            print(f"⊘ {dep_name} - Already exists")
+            skipped_count += 1
+        else:
+            to_create.append(dep_name)
+
+    # Create missing packages concurrently, at most BACKFILL_CONCURRENCY at a
+    # time; registry calls are further bounded by the npm client's LOW slots
+    results = await asyncio.gather(*(create_package(name) for name in to_create))
+    created_count = sum(results)
+    error_count = len(results) - created_count
 
     print(f"\n{'='*60}")
     print(f"SUMMARY")
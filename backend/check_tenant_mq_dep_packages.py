@@ -2,7 +2,6 @@
 Check if tenant-mq dependencies exist as Package records with maintainers.
 """
 from database import get_database, get_database_manager
-from repositories.package import PackageRepository
 
 def main():
     # Connect to database
@@ -10,7 +9,6 @@ def main():
     db_manager.connect()
 
     db = get_database()
-    package_repo = PackageRepository(db)
 
     # Get tenant-mq dependency tree
     dep_tree = db.dependency_trees.find_one({"name": "tenant-mq"})
@@ -32,30 +30,54 @@ def main():
     found_count = 0
     with_maintainers = 0
 
+    # One aggregation for every dependency: match packages on the name
+    # index and join each one's distinct release publishers server-side,
+    # returning only the fields printed below
+    pipeline = [
+        {"$match": {"name": {"$in": all_deps}}},
+        {
+            "$lookup": {
+                "from": "package_releases",
+                "localField": "_id",
+                "foreignField": "package_id",
+                "as": "publishers",
+                "pipeline": [
+                    {"$match": {"published_by": {"$ne": None}}},
+                    {"$group": {"_id": "$published_by"}},
+                ],
+            }
+        },
+        {
+            "$project": {
+                "_id": 0,
+                "name": 1,
+                "risk_score": 1,
+                "maintainers_crawled": {"$ifNull": ["$scan_state.maintainers_crawled", False]},
+                "publisher_count": {"$size": "$publishers"},
+            }
+        },
+    ]
+    packages_by_name = {doc["name"]: doc for doc in db.packages.aggregate(pipeline)}
+
     for dep_name in all_deps:
-        pkg = package_repo.find_by_name(dep_name)
+        pkg = packages_by_name.get(dep_name)
 
         if pkg:
             found_count += 1
             status = "✓"
-            maintainer_status = "✓ Maintainers" if pkg.scan_state.maintainers_crawled else "✗ No maintainers"
-            if pkg.scan_state.maintainers_crawled:
-                with_maintainers += 1
+            crawled = pkg["maintainers_crawled"]
+            maintainer_status = "✓ Maintainers" if crawled else "✗ No maintainers"
+            risk_score = pkg.get("risk_score")
 
             # Get maintainer count
-            if pkg.id and pkg.scan_state.maintainers_crawled:
-                releases = list(db.package_releases.find({"package_id": pkg.id}))
-                identity_ids = set()
-                for release in releases:
-                    if release.get('published_by'):
-                        identity_ids.add(release['published_by'])
-
-                maintainer_count = len(identity_ids)
+            if crawled:
+                with_maintainers += 1
+                maintainer_count = pkg["publisher_count"]
                 print(f"{status} {dep_name}")
-                print(f"   Risk: {pkg.risk_score} | {maintainer_status} ({maintainer_count} maintainers)")
+                print(f"   Risk: {risk_score} | {maintainer_status} ({maintainer_count} maintainers)")
             else:
                 print(f"{status} {dep_name}")
-                print(f"   Risk: {pkg.risk_score} | {maintainer_status}")
+                print(f"   Risk: {risk_score} | {maintainer_status}")
         else:
             print(f"✗ {dep_name}")
             print(f"   NOT FOUND in packages collection")
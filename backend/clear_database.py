@@ -37,15 +37,16 @@ def clear_database():
 
     total_deleted = 0
 
+    # Dropping is a single metadata operation per collection, unlike
+    # delete_many which removes documents one by one. Indexes go with the
+    # collection; the API recreates them (ensure_indexes) on next startup.
     for collection_name in collections:
-        collection = db[collection_name]
-        count = collection.count_documents({})
+        count = db[collection_name].estimated_document_count()
 
         if count > 0:
-            result = collection.delete_many({})
-            deleted = result.deleted_count
-            total_deleted += deleted
-            print(f"✓ {collection_name}: deleted {deleted} documents")
+            db.drop_collection(collection_name)
+            total_deleted += count
+            print(f"✓ {collection_name}: dropped {count} documents")
         else:
             print(f"○ {collection_name}: already empty")
 
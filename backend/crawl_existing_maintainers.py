@@ -7,6 +7,10 @@ from services.npm_client import NpmRegistryClient
 from repositories.package import PackageRepository
 from services.package_service import crawl_package_maintainers
 
+# Packages crawled at once; registry calls are further bounded by the npm
+# client's LOW-priority slots
+CRAWL_CONCURRENCY = 20
+
 async def main():
     # Connect to database
     db_manager = get_database_manager()
@@ -16,15 +20,20 @@ async def main():
     repo = PackageRepository(db)
     npm_client = NpmRegistryClient()
 
-    # Find all packages without maintainers crawled
-    packages = await repo.find_many({"scan_state.maintainers_crawled": False})
+    # Find all packages without maintainers crawled (limit=0: no cap)
+    packages = await repo.find_many({"scan_state.maintainers_crawled": False}, limit=0)
 
     print(f"Found {len(packages)} packages needing maintainer crawl")
 
-    for pkg in packages:
-        print(f"\nCrawling maintainers for {pkg.name}...")
-        count = await crawl_package_maintainers(pkg.name, npm_client, repo)
-        print(f"✓ Processed {count} maintainers")
+    semaphore = asyncio.Semaphore(CRAWL_CONCURRENCY)
+
+    async def crawl(pkg) -> None:
+        async with semaphore:
+            print(f"\nCrawling maintainers for {pkg.name}...")
+            count = await crawl_package_maintainers(pkg.name, npm_client, repo)
+            print(f"✓ {pkg.name}: processed {count} maintainers")
+
+    await asyncio.gather(*(crawl(pkg) for pkg in packages))
 
     print("\nDone!")
 
@@ -4,12 +4,50 @@ Database connection management for MongoDB.
 
 from functools import lru_cache
 from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
 
 import certifi
 from pymongo import MongoClient
 from pymongo.database import Database
 
-from env import MONGODB_URI, MONGODB_DATABASE_NAME
+from env import MONGODB_COMPRESSORS, MONGODB_URI, MONGODB_DATABASE_NAME, MONGODB_MAX_POOL_SIZE
+
+# CA bundle used for SSL certificate validation (helps on macOS); the path is
+# fixed for the life of the process
+_CA_FILE = certifi.where()
+
+# Options added to Atlas (mongodb+srv://) URIs that don't set them already
+_SRV_DEFAULT_OPTIONS = {"retryWrites": "true", "w": "majority"}
+
+
+def _with_default_options(uri: str, defaults: dict) -> str:
+    """
+    Append connection options that the URI doesn't already set.
+
+    Option names are matched exactly (case-insensitively, as the driver
+    does) against the parsed query string; existing options are left as
+    written.
+
+    Args:
+        uri: MongoDB connection URI
+        defaults: Option name -> value to add when absent
+
+    Returns:
+        URI with the missing options appended
+    """
+    query = urlsplit(uri).query
+    present = {key.lower() for key, _ in parse_qsl(query)}
+    missing = {key: value for key, value in defaults.items() if key.lower() not in present}
+    if not missing:
+        return uri
+
+    if query:
+        separator = "&"
+    elif uri.endswith("?"):
+        separator = ""
+    else:
+        separator = "?" if "/" in uri.split("://", 1)[1] else "/?"
+    return f"{uri}{separator}{urlencode(missing)}"
 
 
 class DatabaseManager:
@@ -46,20 +84,19 @@ class DatabaseManager:
 
             # Ensure connection string has required parameters for Atlas
             # mongodb+srv:// automatically uses TLS/SSL
-            if "mongodb+srv://" in connection_uri:
-                # Add retryWrites and w=majority if not present
-                if "retryWrites" not in connection_uri:
-                    separator = "&" if "?" in connection_uri else "?"
-                    connection_uri = f"{connection_uri}{separator}retryWrites=true&w=majority"
-            
+            if connection_uri.startswith("mongodb+srv://"):
+                connection_uri = _with_default_options(connection_uri, _SRV_DEFAULT_OPTIONS)
+
             # Configure MongoDB client with connection options
-            # Use certifi for SSL certificate validation (helps on macOS)
             self._client = MongoClient(
                 connection_uri,
-                tlsCAFile=certifi.where(),
+                tlsCAFile=_CA_FILE,
                 serverSelectionTimeoutMS=30000,
                 connectTimeoutMS=30000,
                 socketTimeoutMS=30000,
+                maxPoolSize=MONGODB_MAX_POOL_SIZE,
+                # The server picks the first compressor it also supports
+                compressors=MONGODB_COMPRESSORS,
             )
             self._database = self._client[db_name]
 
@@ -5,6 +5,8 @@ load_dotenv()
 
 MONGODB_URI = os.getenv("MONGODB_URI")
 MONGODB_DATABASE_NAME = os.getenv("MONGODB_DATABASE_NAME", "intracesentinel")
+MONGODB_MAX_POOL_SIZE = int(os.getenv("MONGODB_MAX_POOL_SIZE", "150"))  # Per-process connection pool cap (PyMongo default: 100)
+MONGODB_COMPRESSORS = os.getenv("MONGODB_COMPRESSORS", "zstd,zlib")  # Wire compression, in preference order
 GITHUB_PAT = os.getenv("GITHUB_PAT")
 OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
 
@@ -5,40 +5,46 @@ Run this script to update the scan_state.deps_crawled flag for packages
 that already have dependency trees in the database but the flag wasn't set.
 """
 
-from database import get_database
+from database import get_database, get_database_manager
+
+# Flag every package that has a stored dependency tree but not
+# scan_state.deps_crawled, entirely server-side. The $lookup is served by the
+# {name, version} index on dependency_trees; $merge writes back only
+# scan_state for the matched packages.
+FIX_DEPS_CRAWLED_PIPELINE = [
+    {"$match": {"scan_state.deps_crawled": {"$ne": True}}},
+    {
+        "$lookup": {
+            "from": "dependency_trees",
+            "localField": "name",
+            "foreignField": "name",
+            "as": "dep_tree",
+            "pipeline": [{"$limit": 1}, {"$project": {"_id": 1}}],
+        }
+    },
+    {"$match": {"dep_tree.0": {"$exists": True}}},
+    {"$project": {"name": 1, "scan_state": 1}},
+    {"$set": {"scan_state.deps_crawled": True}},
+    {"$unset": "name"},
+    {"$merge": {"into": "packages", "on": "_id", "whenMatched": "merge", "whenNotMatched": "discard"}},
+]
 
 
 def fix_deps_crawled_flags():
     """Update deps_crawled flag for packages with existing dependency trees."""
+    db_manager = get_database_manager()
+    db_manager.connect()
     db = get_database()
 
-    # Get all packages
-    packages = list(db.packages.find({}))
-    print(f"Found {len(packages)} packages")
-
-    updated_count = 0
-
-    for pkg in packages:
-        package_name = pkg.get("name")
-
-        # Check if dependency tree exists for this package
-        dep_tree = db.dependency_trees.find_one({"name": package_name})
-
-        if dep_tree and not pkg.get("scan_state", {}).get("deps_crawled", False):
-            # Dependency tree exists but flag is not set
-            print(f"Updating {package_name}...")
-            db.packages.update_one(
-                {"name": package_name},
-                {
-                    "$set": {
-                        "scan_state.deps_crawled": True,
-                    }
-                }
-            )
-            updated_count += 1
-            print(f"  ✓ Updated {package_name}")
-
-    print(f"\nUpdated {updated_count} packages")
+    to_update = db.packages.count_documents({"scan_state.deps_crawled": {"$ne": True}})
+    print(f"Found {to_update} packages without deps_crawled set")
+
+    db.packages.aggregate(FIX_DEPS_CRAWLED_PIPELINE)
+
+    remaining = db.packages.count_documents({"scan_state.deps_crawled": {"$ne": True}})
+    print(f"\nUpdated {to_update - remaining} packages")
+
+    db_manager.disconnect()
 
 
 if __name__ == "__main__":
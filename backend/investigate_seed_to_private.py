@@ -149,19 +149,31 @@ async def main():
     print(f"🔍 RAW COLLECTION CHECKS:")
     print(f"{'='*80}\n")
 
-    # Check dependency trees
-    dep_trees = list(db.dependency_trees.find({"name": package_name}))
-    print(f"Dependency Trees: {len(dep_trees)}")
-    if dep_trees:
-        for tree in dep_trees[:3]:  # First 3
-            print(f"   - Version: {tree.get('version')}, Dependencies: {len(tree.get('dependencies', {}))}")
+    # Check dependency trees: count server-side and fetch only the first 3,
+    # with the direct dependency count computed instead of shipping the tree
+    tree_filter = {"name": package_name}
+    print(f"Dependency Trees: {db.dependency_trees.count_documents(tree_filter)}")
+    tree_preview = db.dependency_trees.aggregate([
+        {"$match": tree_filter},
+        {"$limit": 3},
+        {
+            "$project": {
+                "version": 1,
+                "dependency_count": {
+                    "$size": {"$objectToArray": {"$ifNull": ["$dependencies", {}]}}
+                },
+            }
+        },
+    ])
+    for tree in tree_preview:
+        print(f"   - Version: {tree.get('version')}, Dependencies: {tree['dependency_count']}")
 
     # Check dependencies collection
-    deps = list(db.dependencies.find({"package_name": package_name}))
-    print(f"Dependencies Records: {len(deps)}")
-    if deps:
-        for dep in deps[:3]:  # First 3
-            print(f"   - Parent: {dep.get('parent_package')}, Version: {dep.get('version')}")
+    dep_filter = {"package_name": package_name}
+    print(f"Dependencies Records: {db.dependencies.count_documents(dep_filter)}")
+    dep_preview = db.dependencies.find(dep_filter, {"parent_package": 1, "version": 1}).limit(3)
+    for dep in dep_preview:
+        print(f"   - Parent: {dep.get('parent_package')}, Version: {dep.get('version')}")
 
     print(f"\n{'='*80}")
     print(f"INVESTIGATION COMPLETE")
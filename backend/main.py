@@ -1,24 +1,31 @@
+import asyncio
 from datetime import datetime
 
-from fastapi import Depends, FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 import env
 from api.alerts.router import router as alerts_router
+from api.batch.router import router as batch_router
 from api.deps.router import router as deps_router
+from api.deps.service import ensure_dependency_tree_indexes
 from api.packages.router import router as packages_router
+from api.response_cache import ResponseCacheMiddleware
 from api.identities.router import router as identities_router
 from api.watcher.router import router as watcher_router, init_scheduler, get_scheduler_instance
 from api.deltas.router import router as deltas_router
 from api.threat_surface.router import router as threat_surface_router
 from database import DatabaseManager, get_database, get_database_manager
 from models import Analysis, Package
-from repositories import PackageRepository
+from repositories import PackageRepository, PackageReleaseRepository, RiskAlertRepository
+from repositories.package_threat_assessment import PackageThreatAssessmentRepository
 
 app = FastAPI(
     title="IntraceSentinel API",
     description="Supply chain security monitoring API",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Include routers
@@ -29,14 +36,19 @@ app.include_router(identities_router)
 app.include_router(watcher_router)
 app.include_router(deltas_router)
 app.include_router(threat_surface_router)
+app.include_router(batch_router)
 
 # Initialize database manager
 db_manager = get_database_manager()
 
 
-def get_package_repository(db=Depends(get_database)) -> PackageRepository:
+async def get_package_repository() -> PackageRepository:
     """Dependency injection for PackageRepository."""
-    return PackageRepository(db)
+    return PackageRepository(get_database())
+
+# Cache hot GET responses; added before CORS so CORS stays outermost and
+# sets its headers per request rather than having them replayed from cache
+app.add_middleware(ResponseCacheMiddleware)
 
 # Configure CORS
 app.add_middleware(
@@ -56,6 +68,12 @@ async def startup_event():
         db_manager.client.admin.command("ping")
         print("MongoDB connection successful")
 
+        await PackageRepository(db_manager.database).ensure_indexes()
+        await RiskAlertRepository(db_manager.database).ensure_indexes()
+        await PackageReleaseRepository(db_manager.database).ensure_indexes()
+        await PackageThreatAssessmentRepository(db_manager.database).ensure_indexes()
+        await ensure_dependency_tree_indexes()
+
         # Initialize and start watcher scheduler
         scheduler = init_scheduler(db_manager.database)
         scheduler.start(interval_seconds=30)
@@ -93,7 +111,8 @@ async def root():
 async def health_check():
     """Health check endpoint."""
     try:
-        db_manager.client.admin.command("ping")
+        # The ping can wait out server selection, so keep it off the event loop
+        await asyncio.to_thread(db_manager.client.admin.command, "ping")
         db_status = "connected"
     except Exception:
         db_status = "disconnected"
@@ -3,7 +3,7 @@ Base repository with common CRUD operations.
 """
 
 import asyncio
-from typing import Generic, List, Optional, Type, TypeVar
+from typing import Generic, Iterable, List, Optional, Type, TypeVar
 
 from bson import ObjectId
 from pydantic import BaseModel
@@ -64,6 +64,24 @@ class BaseRepository(Generic[T]):
         doc = await asyncio.to_thread(self.collection.find_one, {"_id": entity_id})
         return self.model_class(**doc) if doc else None
 
+    async def find_by_ids(self, entity_ids: Iterable[str | ObjectId]) -> List[T]:
+        """
+        Find documents by a batch of IDs in a single $in query.
+
+        Args:
+            entity_ids: Document IDs (strings or ObjectIds)
+
+        Returns:
+            List of entities found (missing IDs are skipped)
+        """
+        object_ids = list(
+            {ObjectId(i) if isinstance(i, str) else i for i in entity_ids}
+        )
+        if not object_ids:
+            return []
+
+        return await self.find_many({"_id": {"$in": object_ids}}, limit=len(object_ids))
+
     async def find_one(self, filter_dict: dict) -> Optional[T]:
         """
         Find single document matching filter.
@@ -231,3 +249,20 @@ class BaseRepository(Generic[T]):
         """
         count = await asyncio.to_thread(self.collection.count_documents, filter_dict, limit=1)
         return count > 0
+
+    async def aggregate(self, pipeline: List[dict]) -> List[dict]:
+        """
+        Run an aggregation pipeline and return the raw result documents.
+
+        PyMongo is synchronous, so the cursor is drained on a worker thread
+        rather than on the event loop.
+
+        Args:
+            pipeline: MongoDB aggregation pipeline
+
+        Returns:
+            List of result documents
+        """
+        return await asyncio.to_thread(
+            lambda: list(self.collection.aggregate(pipeline))
+        )
@@ -2,6 +2,7 @@
 Identity repository implementation.
 """
 
+import asyncio
 from typing import List, Optional
 
 from pymongo.database import Database
@@ -33,6 +34,51 @@ class IdentityRepository(BaseRepository[Identity]):
 
         return await self.find_one(filter_dict)
 
+    async def find_publishers_of_package(self, package_name: str) -> Optional[List[Identity]]:
+        """
+        Find the identities that published releases of a package, by package name.
+
+        Rooted at packages: the name match, the distinct publishers of its
+        releases ($group) and their identities run as one aggregation, so
+        neither the releases nor the package document cross the wire.
+
+        Args:
+            package_name: Package name
+
+        Returns:
+            List of publisher identities, or None if the package does not exist
+        """
+        pipeline = [
+            {"$match": {"name": package_name}},
+            {"$limit": 1},
+            {
+                "$lookup": {
+                    "from": "package_releases",
+                    "localField": "_id",
+                    "foreignField": "package_id",
+                    "pipeline": [{"$group": {"_id": "$published_by"}}],
+                    "as": "_publishers",
+                }
+            },
+            {
+                "$lookup": {
+                    "from": self.collection.name,
+                    "localField": "_publishers._id",
+                    "foreignField": "_id",
+                    "as": "_identities",
+                }
+            },
+            {"$project": {"_id": 0, "_identities": 1}},
+        ]
+
+        result = await asyncio.to_thread(
+            lambda: list(self.database.packages.aggregate(pipeline))
+        )
+        if not result:
+            return None
+
+        return [self.model_class(**doc) for doc in result[0]["_identities"]]
+
     async def find_by_kind(self, kind: str, skip: int = 0, limit: int = 100) -> List[Identity]:
         """
         Find identities by kind.
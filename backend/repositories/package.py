@@ -2,13 +2,109 @@
 Package repository implementation.
 """
 
-from typing import List, Optional
+import asyncio
+import re
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
 
+from bson import ObjectId
+from cachetools import TTLCache
 from pymongo.database import Database
 
-from models.package import Package
+from models.package import Package, ScanState
 from repositories.base import BaseRepository
 
+# Process-wide cache of packages by ID. Repositories are created per request,
+# so the cache lives at module level. It is only touched from the event loop
+# thread (never inside to_thread), so it needs no lock.
+PACKAGE_CACHE_TTL_SECONDS = 300
+_package_cache: TTLCache = TTLCache(maxsize=10_000, ttl=PACKAGE_CACHE_TTL_SECONDS)
+
+# Packages by name; refreshed by writes through this repository and cleared
+# on deletes.
+PACKAGE_NAME_CACHE_TTL_SECONDS = 30
+_package_name_cache: TTLCache = TTLCache(maxsize=10_000, ttl=PACKAGE_NAME_CACHE_TTL_SECONDS)
+
+# Stored fields of a Package; list queries project to these so documents
+# carrying extra, unmodelled fields don't pay for them on the wire
+_PACKAGE_PROJECTION = {
+    field.alias or name: 1 for name, field in Package.model_fields.items()
+}
+
+# Projects a package to its stored fields and joins in its newest release
+# as latest_release_date / latest_release_version. The $lookup is backed by
+# the package_releases (package_id, publish_timestamp) index.
+_LATEST_RELEASE_STAGES = [
+    {"$project": _PACKAGE_PROJECTION},
+    {
+        "$lookup": {
+            "from": "package_releases",
+            "localField": "_id",
+            "foreignField": "package_id",
+            "pipeline": [
+                {"$sort": {"publish_timestamp": -1}},
+                {"$limit": 1},
+                {"$project": {"_id": 0, "version": 1, "publish_timestamp": 1}},
+            ],
+            "as": "_latest",
+        }
+    },
+    {
+        "$set": {
+            "latest_release_date": {"$first": "$_latest.publish_timestamp"},
+            "latest_release_version": {"$first": "$_latest.version"},
+        }
+    },
+    {"$unset": "_latest"},
+]
+
+# Turns a package document into a PackageWithLatestRelease-shaped row that
+# serializes directly (string _id, model defaults for missing fields), so
+# list responses skip per-row Pydantic validation
+_PACKAGE_ROW_STAGE = {
+    "$set": {
+        "_id": {"$toString": "$_id"},
+        "registry": {"$ifNull": ["$registry", "npm"]},
+        "repo_url": {"$ifNull": ["$repo_url", None]},
+        "owner": {"$ifNull": ["$owner", None]},
+        "last_scanned": {"$ifNull": ["$last_scanned", None]},
+        "risk_score": {"$ifNull": ["$risk_score", 0]},
+        "is_dependency": {"$ifNull": ["$is_dependency", False]},
+        "scan_state": {"$ifNull": ["$scan_state", ScanState().model_dump()]},
+        "latest_release_date": {"$ifNull": ["$latest_release_date", None]},
+        "latest_release_version": {"$ifNull": ["$latest_release_version", None]},
+    }
+}
+
+
+def _package_cache_key(package_id: str | ObjectId) -> str:
+    return f"package:{package_id}"
+
+
+@lru_cache(maxsize=1024)
+def _name_prefix_patterns(search_term: str) -> Tuple[re.Pattern, ...]:
+    """Compiled patterns behind _name_prefix_filter, cached per search term."""
+    term = re.escape(search_term.strip().lower())
+    if term.startswith("@"):
+        return (re.compile(f"^{term}"),)
+    return (re.compile(f"^{term}"), re.compile(f"^@{term}"))
+
+
+def _name_prefix_filter(search_term: str) -> dict:
+    """
+    Name condition matching packages whose name, or scope, starts with the term.
+
+    npm package names are lowercase, so the term is lowercased and matched
+    with anchored, case-sensitive patterns, which the name index can bound.
+    "babel" matches both "babel-core" and "@babel/core".
+    """
+    return {"$in": list(_name_prefix_patterns(search_term))}
+
+
+def _cache_package(package: Package) -> None:
+    _package_cache[_package_cache_key(package.id)] = package
+    _package_name_cache[package.name] = package
+
 
 class PackageRepository(BaseRepository[Package]):
     """Repository for Package entities."""
@@ -16,9 +112,27 @@ class PackageRepository(BaseRepository[Package]):
     def __init__(self, database: Database):
         super().__init__(database, "packages", Package)
 
+    async def ensure_indexes(self) -> None:
+        """
+        Create the indexes backing package lookups and listings.
+
+        The name index serves find_by_name and can serve the package list's
+        name-ordered page (its $sort runs at the top level of the pipeline);
+        the (is_dependency, name) index serves the list's top-level filter
+        and its total count.
+        """
+        def _create():
+            self.collection.create_index([("name", 1)])
+            self.collection.create_index([("is_dependency", 1), ("name", 1)])
+
+        await asyncio.to_thread(_create)
+
     async def find_by_name(self, name: str) -> Optional[Package]:
         """
-        Find package by name.
+        Find package by name, served from the name cache when possible.
+
+        Misses are not cached, so a package created right after a failed
+        lookup is found immediately.
 
         Args:
             name: Package name
@@ -26,7 +140,157 @@ class PackageRepository(BaseRepository[Package]):
         Returns:
             Package if found, None otherwise
         """
-        return await self.find_one({"name": name})
+        package = _package_name_cache.get(name)
+        if package is None:
+            package = await self.find_one({"name": name})
+            if package:
+                _cache_package(package)
+        return package
+
+    async def find_by_id(self, entity_id: str | ObjectId) -> Optional[Package]:
+        """
+        Find package by ID, served from the TTL cache when possible.
+
+        Args:
+            entity_id: Package ID
+
+        Returns:
+            Package if found, None otherwise
+        """
+        key = _package_cache_key(entity_id)
+        package = _package_cache.get(key)
+        if package is None:
+            package = await super().find_by_id(entity_id)
+            if package:
+                _cache_package(package)
+        return package
+
+    async def find_by_ids(self, ids: Iterable[str | ObjectId]) -> List[Package]:
+        """
+        Find packages by a batch of IDs, querying only the uncached ones.
+
+        Args:
+            ids: Package IDs
+
+        Returns:
+            List of packages found (missing IDs are skipped)
+        """
+        object_ids = {ObjectId(i) if isinstance(i, str) else i for i in ids}
+
+        packages = []
+        missing = []
+        for object_id in object_ids:
+            package = _package_cache.get(_package_cache_key(object_id))
+            if package is None:
+                missing.append(object_id)
+            else:
+                packages.append(package)
+
+        if missing:
+            fetched = await super().find_by_ids(missing)
+            for package in fetched:
+                _cache_package(package)
+            packages.extend(fetched)
+
+        return packages
+
+    async def find_by_names(self, names: Iterable[str]) -> List[Package]:
+        """
+        Find packages by a batch of names in a single $in query.
+
+        Args:
+            names: Package names
+
+        Returns:
+            List of packages found (missing names are skipped)
+        """
+        names = list(set(names))
+        if not names:
+            return []
+
+        def _find():
+            return [Package(**doc) for doc in self.collection.find({"name": {"$in": names}})]
+
+        packages = await asyncio.to_thread(_find)
+        for package in packages:
+            _cache_package(package)
+        return packages
+
+    async def update(self, entity_id: str | ObjectId, update_dict: dict) -> Optional[Package]:
+        """
+        Update package by ID and refresh its cache entry.
+
+        Args:
+            entity_id: Package ID
+            update_dict: Fields to update (uses $set operator)
+
+        Returns:
+            Updated package if found, None otherwise
+        """
+        package = await super().update(entity_id, update_dict)
+        if package:
+            _cache_package(package)
+        else:
+            _package_cache.pop(_package_cache_key(entity_id), None)
+        return package
+
+    async def update_one(self, filter_dict: dict, update_dict: dict) -> Optional[Package]:
+        """
+        Update single package matching filter and refresh its cache entry.
+
+        Args:
+            filter_dict: MongoDB filter query
+            update_dict: Fields to update (uses $set operator)
+
+        Returns:
+            Updated package if found, None otherwise
+        """
+        package = await super().update_one(filter_dict, update_dict)
+        if package:
+            _cache_package(package)
+        return package
+
+    async def delete(self, entity_id: str | ObjectId) -> bool:
+        """
+        Delete package by ID and evict it from the caches.
+
+        Args:
+            entity_id: Package ID
+
+        Returns:
+            True if deleted, False if not found
+        """
+        _package_cache.pop(_package_cache_key(entity_id), None)
+        _package_name_cache.clear()
+        return await super().delete(entity_id)
+
+    async def delete_one(self, filter_dict: dict) -> bool:
+        """
+        Delete single package matching filter and drop the caches.
+
+        Args:
+            filter_dict: MongoDB filter query
+
+        Returns:
+            True if deleted, False if not found
+        """
+        _package_cache.clear()
+        _package_name_cache.clear()
+        return await super().delete_one(filter_dict)
+
+    async def delete_many(self, filter_dict: dict) -> int:
+        """
+        Delete packages matching filter and drop the caches.
+
+        Args:
+            filter_dict: MongoDB filter query
+
+        Returns:
+            Number of packages deleted
+        """
+        _package_cache.clear()
+        _package_name_cache.clear()
+        return await super().delete_many(filter_dict)
 
     async def find_by_registry(self, registry: str, skip: int = 0, limit: int = 100) -> List[Package]:
         """
@@ -102,10 +366,10 @@ class PackageRepository(BaseRepository[Package]):
 
     async def search_by_name(self, search_term: str, skip: int = 0, limit: int = 100) -> List[Package]:
         """
-        Search packages by name (case-insensitive).
+        Search packages by name or scope prefix (case-insensitive, matched literally).
 
         Args:
-            search_term: Search term to match against package names
+            search_term: Prefix to match against package names or scopes
             skip: Number to skip
             limit: Maximum results
 
@@ -113,8 +377,69 @@ class PackageRepository(BaseRepository[Package]):
             List of matching packages
         """
         return await self.find_many(
-            {"name": {"$regex": search_term, "$options": "i"}},
+            {"name": _name_prefix_filter(search_term)},
             skip=skip,
             limit=limit,
             sort=[("name", 1)],
         )
+
+    async def find_by_name_with_latest_release(self, name: str) -> Optional[dict]:
+        """
+        Find a package by name together with its latest release in one query.
+
+        Args:
+            name: Package name
+
+        Returns:
+            Package document with latest_release_date and
+            latest_release_version, or None if not found
+        """
+        docs = await self.aggregate(
+            [{"$match": {"name": name}}, {"$limit": 1}, *_LATEST_RELEASE_STAGES]
+        )
+        return docs[0] if docs else None
+
+    async def list_with_latest_release(
+        self,
+        search_term: Optional[str] = None,
+        filter_dict: Optional[dict] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> Tuple[List[dict], int]:
+        """
+        Fetch one page of packages with their latest release, plus the total
+        match count.
+
+        The page is a top-level $match/$sort/$skip/$limit aggregation, so the
+        sort can be served by an index rather than done in memory, and each
+        package on the page picks up its newest release through
+        _LATEST_RELEASE_STAGES. The total is an exact count_documents on the
+        same filter, run concurrently.
+
+        Args:
+            search_term: Optional name or scope prefix to match
+            filter_dict: Additional MongoDB filter query
+            skip: Number to skip
+            limit: Maximum results
+
+        Returns:
+            Tuple of (PackageWithLatestRelease-shaped dicts, total matching
+            packages)
+        """
+        match = dict(filter_dict or {})
+        if search_term:
+            match["name"] = _name_prefix_filter(search_term)
+
+        pipeline = [
+            {"$match": match},
+            {"$sort": {"name": 1}},
+            {"$skip": skip},
+            {"$limit": limit},
+            *_LATEST_RELEASE_STAGES,
+            _PACKAGE_ROW_STAGE,
+        ]
+
+        packages, total = await asyncio.gather(
+            self.aggregate(pipeline), self.count(match)
+        )
+        return packages, total
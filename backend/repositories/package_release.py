@@ -2,6 +2,7 @@
 PackageRelease repository implementation.
 """
 
+import asyncio
 from datetime import datetime
 from typing import List, Optional
 
@@ -18,6 +19,20 @@ class PackageReleaseRepository(BaseRepository[PackageRelease]):
     def __init__(self, database: Database):
         super().__init__(database, "package_releases", PackageRelease)
 
+    async def ensure_indexes(self) -> None:
+        """
+        Create the indexes backing per-package release lookups.
+
+        Releases are mostly read per package newest first (find_by_package
+        and the latest-release $lookup on the package list). The (package_id, published_by) index lets the package
+        maintainers query group publishers from the index alone.
+        """
+        def _create():
+            self.collection.create_index([("package_id", 1), ("publish_timestamp", -1)])
+            self.collection.create_index([("package_id", 1), ("published_by", 1)])
+
+        await asyncio.to_thread(_create)
+
     async def find_by_package(
         self, package_id: str | ObjectId, skip: int = 0, limit: int = 100
     ) -> List[PackageRelease]:
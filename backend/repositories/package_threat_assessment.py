@@ -4,7 +4,7 @@ Package Threat Assessment repository.
 
 import asyncio
 from bson import ObjectId
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from models.package_threat_assessment import PackageThreatAssessment
 from repositories.base import BaseRepository
@@ -18,6 +18,20 @@ class PackageThreatAssessmentRepository(BaseRepository[PackageThreatAssessment])
             database, "package_threat_assessments", PackageThreatAssessment
         )
 
+    async def ensure_indexes(self) -> None:
+        """
+        Create the indexes backing assessment lookups.
+
+        Per-package reads sort newest first, optionally for one version;
+        risk-level listings also sort newest first.
+        """
+        def _create():
+            self.collection.create_index([("package_id", 1), ("timestamp", -1)])
+            self.collection.create_index([("package_id", 1), ("version", 1)])
+            self.collection.create_index([("overall_risk_level", 1), ("timestamp", -1)])
+
+        await asyncio.to_thread(_create)
+
     async def find_current_by_package(
         self, package_id: ObjectId
     ) -> Optional[PackageThreatAssessment]:
@@ -87,6 +101,57 @@ class PackageThreatAssessmentRepository(BaseRepository[PackageThreatAssessment])
             return self.model_class(**doc)
         return None
 
+    async def find_for_package_name(
+        self,
+        package_name: str,
+        filter_dict: Optional[dict] = None,
+        limit: int = 10,
+    ) -> Optional[Tuple[str, List[PackageThreatAssessment]]]:
+        """
+        Get a package's assessments by package name in a single aggregation.
+
+        Rooted at packages: the name match and the assessment lookup run
+        under one plan via $lookup, so no separate package lookup round
+        trip is needed before the assessments can be fetched.
+
+        Args:
+            package_name: Package name
+            filter_dict: Additional assessment filter (e.g. version)
+            limit: Maximum number of assessments to retrieve
+
+        Returns:
+            Tuple of (package name, assessments newest first), or None if
+            the package does not exist
+        """
+        pipeline = [
+            {"$match": {"name": package_name}},
+            {"$limit": 1},
+            {
+                "$lookup": {
+                    "from": self.collection.name,
+                    "localField": "_id",
+                    "foreignField": "package_id",
+                    "pipeline": [
+                        {"$match": filter_dict or {}},
+                        {"$sort": {"timestamp": -1}},
+                        {"$limit": limit},
+                    ],
+                    "as": "_assessments",
+                }
+            },
+            {"$project": {"_id": 0, "name": 1, "_assessments": 1}},
+        ]
+
+        result = await asyncio.to_thread(
+            lambda: list(self.database.packages.aggregate(pipeline))
+        )
+        if not result:
+            return None
+
+        return result[0]["name"], [
+            self.model_class(**doc) for doc in result[0]["_assessments"]
+        ]
+
     async def find_by_risk_level(
         self, risk_level: str, limit: int = 100
     ) -> List[PackageThreatAssessment]:
@@ -112,19 +177,34 @@ class PackageThreatAssessmentRepository(BaseRepository[PackageThreatAssessment])
 
     async def get_stats(self) -> dict:
         """
-        Get statistics about threat assessments.
+        Get statistics about threat assessments in a single aggregation.
+
+        One $facet computes the per-risk-level counts and the number of
+        distinct packages assessed, so the stats endpoint is one round trip.
 
         Returns:
-            Dictionary with statistics
+            Dictionary with total, by_risk_level and packages_assessed
         """
-        def _aggregate():
-            pipeline = [{"$group": {"_id": "$overall_risk_level", "count": {"$sum": 1}}}]
-            result = {"total": 0, "by_risk_level": {}}
-            for doc in self.collection.aggregate(pipeline):
-                risk_level = doc["_id"]
-                count = doc["count"]
-                result["by_risk_level"][risk_level] = count
-                result["total"] += count
-            return result
-
-        return await asyncio.to_thread(_aggregate)
+        pipeline = [
+            {
+                "$facet": {
+                    "by_risk_level": [
+                        {"$group": {"_id": "$overall_risk_level", "count": {"$sum": 1}}}
+                    ],
+                    "packages_assessed": [
+                        {"$group": {"_id": "$package_id"}},
+                        {"$count": "n"},
+                    ],
+                }
+            }
+        ]
+
+        facets = (await self.aggregate(pipeline))[0]
+        by_risk_level = {doc["_id"]: doc["count"] for doc in facets["by_risk_level"]}
+        packages_assessed = facets["packages_assessed"]
+
+        return {
+            "total": sum(by_risk_level.values()),
+            "by_risk_level": by_risk_level,
+            "packages_assessed": packages_assessed[0]["n"] if packages_assessed else 0,
+        }
@@ -2,7 +2,10 @@
 RiskAlert repository implementation.
 """
 
-from typing import List
+import asyncio
+import itertools
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Tuple
 
 from bson import ObjectId
 from pymongo.database import Database
@@ -10,6 +13,113 @@ from pymongo.database import Database
 from models.risk_alert import RiskAlert
 from repositories.base import BaseRepository
 
+# Stable newest-first order used by alert listings; _id breaks timestamp ties
+KEYSET_SORT = [("timestamp", -1), ("_id", -1)]
+
+# ISO-8601 (UTC, millisecond precision) rendered server-side by $dateToString,
+# so listing responses carry ready-made strings instead of datetimes
+ISO_DATE_FORMAT = "%Y-%m-%dT%H:%M:%S.%LZ"
+
+HIGH_SEVERITY_THRESHOLD = 70.0
+RECENT_ALERTS_LIMIT = 5
+
+# Response-shaped projection of an alert document (everything but package_name).
+# ObjectIds are rendered as hex strings server-side; $toString of a missing or
+# null reference yields null.
+_ALERT_PROJECTION = {
+    "_id": 0,
+    "id": {"$toString": "$_id"},
+    "package_id": {"$toString": "$package_id"},
+    "identity_id": {"$toString": "$identity_id"},
+    "release_id": {"$toString": "$release_id"},
+    "delta_id": {"$toString": "$delta_id"},
+    "reason": 1,
+    "severity": 1,
+    "timestamp": {"$dateToString": {"date": "$timestamp", "format": ISO_DATE_FORMAT}},
+    "status": 1,
+    "analysis": {
+        "$mergeObjects": [
+            "$analysis",
+            {
+                "updated_at": {
+                    "$dateToString": {
+                        "date": "$analysis.updated_at",
+                        "format": ISO_DATE_FORMAT,
+                    }
+                }
+            },
+        ]
+    },
+}
+
+# Stages joining the package name onto alert documents. Pipelines are built
+# once at import time; per-request code only prepends its own $match/$sort.
+# The concise localField/foreignField + pipeline $lookup (MongoDB 5.0+) keeps
+# the _id index seek while projecting only `name` out of each package.
+_PACKAGE_NAME_STAGES = [
+    {
+        "$lookup": {
+            "from": "packages",
+            "localField": "package_id",
+            "foreignField": "_id",
+            "pipeline": [{"$project": {"_id": 0, "name": 1}}],
+            "as": "_pkg",
+        }
+    },
+    {"$unwind": {"path": "$_pkg", "preserveNullAndEmptyArrays": True}},
+    {
+        "$project": {
+            **_ALERT_PROJECTION,
+            "package_name": {"$ifNull": ["$_pkg.name", "unknown"]},
+        }
+    },
+]
+
+_KEYSET_SORT_STAGE = {"$sort": dict(KEYSET_SORT)}
+
+_STATS_PIPELINE = [
+    {
+        "$facet": {
+            "by_status": [
+                {"$group": {"_id": "$status", "count": {"$sum": 1}}},
+            ],
+            "high_severity": [
+                {"$match": {"severity": {"$gte": HIGH_SEVERITY_THRESHOLD}}},
+                {"$count": "count"},
+            ],
+            "average": [
+                {"$group": {"_id": None, "avg_severity": {"$avg": "$severity"}}},
+            ],
+            "recent": [
+                _KEYSET_SORT_STAGE,
+                {"$limit": RECENT_ALERTS_LIMIT},
+                *_PACKAGE_NAME_STAGES,
+            ],
+        }
+    },
+]
+
+
+def keyset_filter(filter_dict: dict, after: Tuple[datetime, ObjectId]) -> dict:
+    """
+    Restrict a filter to alerts strictly after a (timestamp, _id) position.
+
+    Args:
+        filter_dict: MongoDB filter query
+        after: (timestamp, _id) of the last alert on the previous page
+
+    Returns:
+        Filter matching only alerts that sort after `after` in KEYSET_SORT
+    """
+    after_timestamp, after_id = after
+    return {
+        **filter_dict,
+        "$or": [
+            {"timestamp": {"$lt": after_timestamp}},
+            {"timestamp": after_timestamp, "_id": {"$lt": after_id}},
+        ],
+    }
+
 
 class RiskAlertRepository(BaseRepository[RiskAlert]):
     """Repository for RiskAlert entities."""
@@ -139,3 +249,169 @@ class RiskAlertRepository(BaseRepository[RiskAlert]):
             limit=limit,
             sort=[("severity", -1), ("timestamp", -1)],
         )
+
+    async def stream_alerts_with_packages(
+        self,
+        filter_dict: dict,
+        skip: int = 0,
+        limit: int = 100,
+        sort: Optional[List[tuple]] = None,
+        batch_size: int = 20,
+    ) -> AsyncIterator[dict]:
+        """
+        Stream alerts joined with their package name without materializing the page.
+
+        The aggregation cursor is drained in batches on a worker thread, so
+        at most one batch is held in memory at a time.
+
+        Args:
+            filter_dict: MongoDB filter query
+            skip: Number to skip
+            limit: Maximum results
+            sort: List of (field, direction) tuples (default: newest first)
+            batch_size: Documents fetched per worker-thread hop
+
+        Yields:
+            AlertResponse-shaped dicts (string IDs and timestamps)
+        """
+        pipeline = [
+            {"$match": filter_dict},
+            {"$sort": dict(sort or [("timestamp", -1)])},
+            {"$skip": skip},
+            {"$limit": limit},
+            *_PACKAGE_NAME_STAGES,
+        ]
+
+        cursor = await asyncio.to_thread(
+            self.collection.aggregate, pipeline, batchSize=batch_size
+        )
+        try:
+            while batch := await asyncio.to_thread(
+                lambda: list(itertools.islice(cursor, batch_size))
+            ):
+                for doc in batch:
+                    yield doc
+        finally:
+            await asyncio.to_thread(cursor.close)
+
+    async def find_page_for_package_name(
+        self,
+        package_name: str,
+        filter_dict: dict,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[Tuple[datetime, ObjectId]] = None,
+    ) -> Optional[Tuple[List[dict], int, bool]]:
+        """
+        Find a page of a package's alerts by package name in a single aggregation.
+
+        Rooted at packages: the name match and the alert page/count run
+        under one plan via $lookup into risk_alerts, so no separate
+        package lookup round trip is needed.
+
+        Args:
+            package_name: Package name
+            filter_dict: Additional alert filter (status, severity, ...)
+            skip: Number to skip (ignored when `after` is given)
+            limit: Maximum results
+            after: (timestamp, _id) of the last alert on the previous page
+
+        Returns:
+            Tuple of (AlertResponse-shaped dicts, total matching,
+            whether more alerts follow this page), or None if the package
+            does not exist
+        """
+        page = [
+            _KEYSET_SORT_STAGE,
+            {"$skip": 0 if after else skip},
+            {"$limit": limit + 1},
+            {"$project": {**_ALERT_PROJECTION, "package_name": "$$package_name"}},
+        ]
+        if after:
+            page.insert(0, {"$match": keyset_filter({}, after)})
+
+        pipeline = [
+            {"$match": {"name": package_name}},
+            {"$limit": 1},
+            {
+                "$lookup": {
+                    "from": self.collection.name,
+                    "localField": "_id",
+                    "foreignField": "package_id",
+                    "let": {"package_name": "$name"},
+                    "pipeline": [
+                        {"$match": filter_dict},
+                        {
+                            "$facet": {
+                                "page": page,
+                                "total": [{"$count": "count"}],
+                            }
+                        },
+                    ],
+                    "as": "_alerts",
+                }
+            },
+            {"$project": {"_id": 0, "_alerts": {"$first": "$_alerts"}}},
+        ]
+
+        result = await asyncio.to_thread(
+            lambda: list(self.database.packages.aggregate(pipeline))
+        )
+        if not result:
+            return None
+
+        facets = result[0].get("_alerts") or {}
+        alerts = facets.get("page", [])
+        total = (facets.get("total") or [{"count": 0}])[0]["count"]
+        return alerts[:limit], total, len(alerts) > limit
+
+    async def ensure_indexes(self) -> None:
+        """
+        Create the indexes backing every filter + sort used by alert queries.
+
+        Listings sort on (timestamp, _id) descending and filter by any mix
+        of status, package_id and severity; each equality filter gets a
+        compound index ending in the sort keys so the sort is index-backed.
+        The severity index also serves `severity_min` filters, the
+        high-severity dashboard count and find_high_severity.
+        """
+        def _create():
+            self.collection.create_index([("timestamp", -1), ("_id", -1)])
+            self.collection.create_index(
+                [("status", 1), ("timestamp", -1), ("_id", -1)]
+            )
+            self.collection.create_index(
+                [("package_id", 1), ("timestamp", -1), ("_id", -1)]
+            )
+            self.collection.create_index([("severity", -1), ("timestamp", -1)])
+
+        await asyncio.to_thread(_create)
+
+    async def get_stats(self) -> dict:
+        """
+        Get dashboard statistics for alerts in a single aggregation.
+
+        Status counts, high-severity count, average severity and the most
+        recent alerts (joined with package names) are computed as branches
+        of one $facet, so the whole dashboard costs one round trip.
+
+        Returns:
+            Dictionary with total, by_status, high_severity_count,
+            average_severity and recent_alerts
+        """
+        def _aggregate():
+            facets = next(self.collection.aggregate(_STATS_PIPELINE), {})
+            by_status = {
+                doc["_id"]: doc["count"] for doc in facets.get("by_status", [])
+            }
+            high_severity = facets.get("high_severity") or [{"count": 0}]
+            average = facets.get("average") or [{"avg_severity": None}]
+            return {
+                "total": sum(by_status.values()),
+                "by_status": by_status,
+                "high_severity_count": high_severity[0]["count"],
+                "average_severity": average[0]["avg_severity"] or 0.0,
+                "recent_alerts": facets.get("recent", []),
+            }
+
+        return await asyncio.to_thread(_aggregate)
@@ -4,6 +4,7 @@ AI Threat Surface Service - generates comprehensive threat surface assessments.
 
 import json
 import asyncio
+import os
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 from bson import ObjectId
@@ -11,6 +12,7 @@ from bson import ObjectId
 from agno.agent import Agent
 from agno.models.openrouter import OpenRouter
 
+from database import get_database
 from models.package import Package
 from models.package_release import PackageRelease
 from models.identity import Identity
@@ -104,8 +106,9 @@ Always provide comprehensive narrative assessments (2-4 paragraphs) that give th
             dependencies = []
             try:
                 # Try to fetch dependency tree from database
-                dep_tree = self.database.dependency_trees.find_one(
-                    {"name": package_name, "version": latest_release.version}
+                dep_tree = await asyncio.to_thread(
+                    self.database.dependency_trees.find_one,
+                    {"name": package_name, "version": latest_release.version},
                 )
                 if dep_tree:
                     # Flatten dependencies for analysis
@@ -123,16 +126,14 @@ Always provide comprehensive narrative assessments (2-4 paragraphs) that give th
             try:
                 # Get all identities who have published releases for this package
                 all_releases = await release_repo.find_by_package(package.id, limit=50)
-                identity_ids = set()
-                for release in all_releases:
-                    if release.published_by:
-                        identity_ids.add(release.published_by)
+                identity_ids = {
+                    release.published_by
+                    for release in all_releases
+                    if release.published_by
+                }
 
-                # Fetch identities by ID
-                for identity_id in identity_ids:
-                    identity = await identity_repo.find_by_id(identity_id)
-                    if identity:
-                        maintainers.append(identity)
+                # Fetch identities in one query
+                maintainers = await identity_repo.find_by_ids(identity_ids)
 
                 print(
                     f"[ai_threat_surface_service] Found {len(maintainers)} maintainers"
@@ -544,3 +545,27 @@ IMPORTANT:
             },
             dependency_depth_analyzed=0,
         )
+
+
+# Global singleton instance
+_threat_surface_service: Optional[AIThreatSurfaceService] = None
+
+
+def get_threat_surface_service() -> Optional[AIThreatSurfaceService]:
+    """
+    Get the process-wide AIThreatSurfaceService.
+
+    Built on first use so every assessment (API jobs, dependency crawls,
+    new packages, the watcher queue) shares one agent and its HTTP client
+    instead of constructing a fresh one per job.
+
+    Returns:
+        AIThreatSurfaceService, or None if OPENROUTER_API_KEY is not set
+    """
+    global _threat_surface_service
+    if _threat_surface_service is None:
+        api_key = os.getenv("OPENROUTER_API_KEY")
+        if not api_key:
+            return None
+        _threat_surface_service = AIThreatSurfaceService(get_database(), api_key)
+    return _threat_surface_service
@@ -43,6 +43,8 @@ class BackgroundJobManager:
     def __init__(self):
         self._jobs: Dict[str, Job] = {}
         self._tasks: Dict[str, asyncio.Task] = {}
+        self._type_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._change_events: Dict[str, asyncio.Event] = {}
 
     def create_job(self, job_type: str, metadata: Optional[Dict[str, Any]] = None) -> str:
         """
@@ -73,6 +75,7 @@ class BackgroundJobManager:
         self,
         job_id: str,
         coro: Coroutine,
+        max_concurrent: Optional[int] = None,
     ) -> None:
         """
         Start executing a job in the background.
@@ -80,30 +83,50 @@ class BackgroundJobManager:
         Args:
             job_id: Job ID
             coro: Coroutine to execute
+            max_concurrent: Optional cap on concurrently running jobs of this
+                job's type; jobs over the cap stay pending until a slot frees
         """
         if job_id not in self._jobs:
             raise ValueError(f"Job {job_id} not found")
 
         job = self._jobs[job_id]
-        job.status = JobStatus.RUNNING
-        job.started_at = datetime.now(timezone.utc)
+
+        slot = None
+        if max_concurrent is not None:
+            slot = self._type_semaphores.get(job.type)
+            if slot is None:
+                slot = self._type_semaphores[job.type] = asyncio.Semaphore(max_concurrent)
+        else:
+            job.status = JobStatus.RUNNING
+            job.started_at = datetime.now(timezone.utc)
+            self._notify(job_id)
 
         # Create background task
-        task = asyncio.create_task(self._execute_job(job_id, coro))
+        task = asyncio.create_task(self._execute_job(job_id, coro, slot))
         self._tasks[job_id] = task
 
-    async def _execute_job(self, job_id: str, coro: Coroutine) -> None:
+    async def _execute_job(
+        self, job_id: str, coro: Coroutine, slot: Optional[asyncio.Semaphore] = None
+    ) -> None:
         """
         Execute a job and update its status.
 
         Args:
             job_id: Job ID
             coro: Coroutine to execute
+            slot: Semaphore bounding concurrent jobs of this type, if any
         """
         job = self._jobs[job_id]
 
         try:
-            result = await coro
+            if slot is None:
+                result = await coro
+            else:
+                async with slot:
+                    job.status = JobStatus.RUNNING
+                    job.started_at = datetime.now(timezone.utc)
+                    self._notify(job_id)
+                    result = await coro
             job.status = JobStatus.COMPLETED
             job.result = result
             job.completed_at = datetime.now(timezone.utc)
@@ -116,6 +139,31 @@ class BackgroundJobManager:
             # Clean up task reference
             if job_id in self._tasks:
                 del self._tasks[job_id]
+            self._notify(job_id)
+
+    def watch(self, job_id: str) -> asyncio.Event:
+        """
+        Get an event that is set on the job's next status or progress change.
+
+        Take the event before reading the job's state, then await it; a
+        change landing in between still sets the event, so none is missed.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Event for the next change of this job
+        """
+        event = self._change_events.get(job_id)
+        if event is None:
+            event = self._change_events[job_id] = asyncio.Event()
+        return event
+
+    def _notify(self, job_id: str) -> None:
+        """Wake everyone watching a job; later watchers get a fresh event."""
+        event = self._change_events.pop(job_id, None)
+        if event is not None:
+            event.set()
 
     def get_job(self, job_id: str) -> Optional[Job]:
         """
@@ -139,6 +187,7 @@ class BackgroundJobManager:
         """
         if job_id in self._jobs:
             self._jobs[job_id].progress = progress
+            self._notify(job_id)
 
     def list_jobs(self, job_type: Optional[str] = None) -> list[Job]:
         """
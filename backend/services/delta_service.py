@@ -14,7 +14,7 @@ from pymongo.database import Database
 from models.package_delta import PackageDelta, Signals
 from models.analysis import Analysis
 from repositories import PackageDeltaRepository, PackageRepository, PackageReleaseRepository
-from services.npm_client import NpmRegistryClient
+from services.npm_client import get_npm_client
 from services.tarball_extractor import TarballExtractor, TarballContent
 
 
@@ -33,7 +33,7 @@ class DeltaService:
         self.delta_repo = PackageDeltaRepository(database)
         self.package_repo = PackageRepository(database)
         self.release_repo = PackageReleaseRepository(database)
-        self.npm_client = NpmRegistryClient()
+        self.npm_client = get_npm_client()
         self.tarball_extractor = TarballExtractor()
 
     async def compute_delta(
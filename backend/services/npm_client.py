@@ -8,6 +8,7 @@ from typing import Dict, List, Optional
 from dataclasses import dataclass
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from services.priority_resource_manager import Priority, get_resource_manager
 
@@ -61,11 +62,21 @@ class NpmRegistryClient:
         """Initialize the npm client (only runs once due to singleton)."""
         # Only initialize once (singleton pattern)
         if not hasattr(self, '_initialized'):
+            self._resource_manager = get_resource_manager()
             self._session = requests.Session()
             self._session.headers.update(
                 {"Accept": "application/json", "User-Agent": "IntraceSentinel/1.0"}
             )
-            self._resource_manager = get_resource_manager()
+
+            # Size the keep-alive pool to the most calls the resource manager
+            # lets run at once (HIGH and LOW semaphores are independent), so
+            # concurrent worker threads reuse connections instead of
+            # discarding them past requests' default of 10 per host.
+            stats = self._resource_manager.get_stats()
+            pool_size = stats["total_capacity"] + stats["low_priority_max"]
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
             self._initialized = True
 
     async def get_package_metadata(
@@ -286,4 +297,18 @@ class NpmRegistryClient:
             time=time_map,
             repository_url=top_repo_url,
             maintainers=[m.get("name", "") for m in data.get("maintainers", [])],
-        )
\ No newline at end of file
+        )
+
+
+def get_npm_client() -> NpmRegistryClient:
+    """
+    Get the process-wide NpmRegistryClient.
+
+    Routers, the dependency crawler and background services should all use
+    this accessor so every registry call shares one session and its
+    keep-alive connection pool.
+
+    Returns:
+        NpmRegistryClient singleton instance
+    """
+    return NpmRegistryClient()
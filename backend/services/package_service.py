@@ -3,7 +3,6 @@ Package service - shared business logic for package operations.
 """
 
 import asyncio
-import os
 from typing import Optional
 from datetime import datetime, timezone
 
@@ -122,14 +121,12 @@ async def get_or_create_package_with_enrichment(
     if not is_dependency:
         try:
             # Import here to avoid circular imports
-            from services.ai_threat_surface_service import AIThreatSurfaceService
+            from services.ai_threat_surface_service import get_threat_surface_service
 
-            # Check if OpenRouter API key is available
-            OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
-            if OPENROUTER_API_KEY:
+            # Shared service; None when no OpenRouter API key is configured
+            threat_service = get_threat_surface_service()
+            if threat_service:
                 print(f"[package_service] Triggering threat assessment for {package_name}...")
-                db = get_database()
-                threat_service = AIThreatSurfaceService(db, OPENROUTER_API_KEY)
                 # Run in background task to avoid blocking
                 asyncio.create_task(threat_service.generate_assessment_for_package(package_name))
                 print(f"[package_service] Threat assessment task started")
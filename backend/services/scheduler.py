@@ -32,6 +32,8 @@ class WatcherScheduler:
         self._last_result: Optional[dict] = None
         self._is_running = False
         self._error_count = 0
+        # Bumped on every change visible in get_status()
+        self._state_version = 0
 
         # Add event listeners
         self.scheduler.add_listener(
@@ -69,6 +71,7 @@ class WatcherScheduler:
 
         self.scheduler.start()
         self._is_running = True
+        self._state_version += 1
         print(f"[scheduler] Watcher scheduler started with {interval_seconds}s interval")
         return True
 
@@ -86,6 +89,7 @@ class WatcherScheduler:
         self.scheduler.remove_job(self.JOB_ID)
         self.scheduler.shutdown(wait=False)
         self._is_running = False
+        self._state_version += 1
         print("[scheduler] Watcher scheduler stopped")
         return True
 
@@ -96,6 +100,7 @@ class WatcherScheduler:
 
         # Pause the scheduler job
         self.scheduler.pause_job(self.JOB_ID)
+        self._state_version += 1
 
         # Set global pause flag to stop background AI tasks
         pause_manager = get_pause_manager()
@@ -111,6 +116,7 @@ class WatcherScheduler:
 
         # Resume the scheduler job
         self.scheduler.resume_job(self.JOB_ID)
+        self._state_version += 1
 
         # Clear global pause flag to allow background AI tasks
         pause_manager = get_pause_manager()
@@ -129,6 +135,17 @@ class WatcherScheduler:
         print("[scheduler] Triggering immediate poll")
         return await self._run_poll()
 
+    @property
+    def state_version(self) -> int:
+        """
+        Counter that changes whenever get_status() would return new data.
+
+        Covers start/stop, pause/resume, each poll (including the job's
+        next_run_time, which APScheduler advances just before the poll
+        starts) and job errors.
+        """
+        return self._state_version
+
     def get_status(self) -> dict:
         """
         Get current scheduler status.
@@ -158,6 +175,7 @@ class WatcherScheduler:
     async def _run_poll(self) -> dict:
         """Execute the poll cycle."""
         self._last_run = datetime.now(timezone.utc)
+        self._state_version += 1
 
         try:
             result = await self.watcher_service.poll_all_packages()
@@ -168,6 +186,8 @@ class WatcherScheduler:
             self._error_count += 1
             self._last_result = {"error": str(e)}
             raise
+        finally:
+            self._state_version += 1
 
     def _on_job_executed(self, _event):
         """Handler for successful job execution."""
@@ -177,3 +197,4 @@ class WatcherScheduler:
         """Handler for job errors."""
         print(f"[scheduler] ERROR: Job error: {event.job_id} - {event.exception}")
         self._error_count += 1
+        self._state_version += 1
@@ -21,14 +21,14 @@ from repositories import (
     IdentityRepository,
 )
 from repositories.package_threat_assessment import PackageThreatAssessmentRepository
-from services.npm_client import NpmRegistryClient, NpmVersionInfo
+from services.npm_client import NpmVersionInfo, get_npm_client
 from services.github_client import GitHubApiClient
 from services.tarball_extractor import TarballExtractor, TarballContent
 from services.risk_scorer import RiskScorer
 from services.delta_service import DeltaService
 from services.package_service import get_or_create_package_with_enrichment, crawl_package_maintainers
 from services.ai_alert_service import AIAlertService
-from services.ai_threat_surface_service import AIThreatSurfaceService
+from services.ai_threat_surface_service import get_threat_surface_service
 from services.ai_analysis_queue import AIAnalysisQueue
 from services.package_risk_aggregator import PackageRiskAggregator
 from env import OPENROUTER_API_KEY, AI_ANALYSIS_DELAY, AI_PRIORITY_THRESHOLD
@@ -74,7 +74,7 @@ class WatcherService:
         self.threat_surface_repo = PackageThreatAssessmentRepository(database)
 
         # Clients and analyzers
-        self.npm_client = NpmRegistryClient()
+        self.npm_client = get_npm_client()
         self.github_client = GitHubApiClient()
         self.tarball_extractor = TarballExtractor()
         self.risk_scorer = RiskScorer()
@@ -84,7 +84,7 @@ class WatcherService:
         # AI analysis queue (only initialize if API key is available)
         if OPENROUTER_API_KEY:
             ai_alert_service = AIAlertService(database, OPENROUTER_API_KEY)
-            ai_threat_surface_service = AIThreatSurfaceService(database, OPENROUTER_API_KEY)
+            ai_threat_surface_service = get_threat_surface_service()
             self.ai_queue = AIAnalysisQueue(
                 database=database,
                 ai_alert_service=ai_alert_service,
@@ -0,0 +1,68 @@
+"""
+Test script to verify a failing or hanging /batch sub-request doesn't affect
+the others.
+"""
+import asyncio
+
+import httpx
+from fastapi import FastAPI
+
+import api.batch.router as batch_module
+from api.batch.router import router as batch_router
+
+
+def build_app() -> FastAPI:
+    """Minimal app with a healthy, a crashing and a never-ending GET endpoint."""
+    app = FastAPI()
+    app.include_router(batch_router)
+
+    @app.get("/ok")
+    async def ok():
+        return {"hello": "world"}
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("sub-request exploded")
+
+    @app.get("/hang")
+    async def hang():
+        await asyncio.Event().wait()
+
+    return app
+
+
+async def main():
+    batch_module.SUB_REQUEST_TIMEOUT_SECONDS = 0.5
+    transport = httpx.ASGITransport(app=build_app(), raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/batch",
+            json={
+                "requests": {
+                    "good": {"path": "/ok"},
+                    "bad": {"path": "/boom"},
+                    "slow": {"path": "/hang"},
+                }
+            },
+        )
+
+    print(f"\n{'='*60}")
+    print("BATCH SUB-REQUEST ISOLATION")
+    print(f"{'='*60}\n")
+    print(f"Batch status: {response.status_code}")
+
+    assert response.status_code == 200, response.text
+    responses = response.json()["responses"]
+    print(f"good: {responses['good']}")
+    print(f"bad:  {responses['bad']}")
+    print(f"slow: {responses['slow']}")
+
+    assert responses["good"] == {"status": 200, "body": {"hello": "world"}}
+    assert responses["bad"]["status"] == 500
+    assert responses["slow"]["status"] == 504
+
+    print("\n✓ Failing and hanging sub-requests were isolated")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())